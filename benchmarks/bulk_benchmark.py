@@ -0,0 +1,77 @@
+"""Compares task import/update throughput of the single-item endpoints against POST/PATCH /tasks/bulk.
+
+Run from the repository root: python benchmarks/bulk_benchmark.py [tasks] [batch size]
+Uses a throwaway SQLite file unless DB_URL is exported, every request goes through the full ASGI stack.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+DB_FILE = os.path.join(tempfile.mkdtemp(prefix="smtt-bench-"), "bulk.db")
+os.environ.setdefault("DB_URL", f"sqlite+aiosqlite:///{DB_FILE}")
+
+# seed puts the repository on sys.path and fills the settings environment, so it is imported first
+from seed import api_client, task_rows
+
+def payloads(count):
+    return [
+        {
+            "title": row["title"],
+            "description": row["description"],
+            "due_datetime": row["due_datetime"].isoformat() if row["due_datetime"] else None,
+            "status": row["status"].value,
+            "priority": row["priority"].value,
+            "category": row["category"].value,
+            "assigneeId": 1,
+        }
+        for row in task_rows(count)
+    ]
+
+def report(label, count, elapsed):
+    print(f"{label:<28} {count:>6} tasks in {elapsed:7.2f}s  {count / elapsed:9.1f} tasks/sec")
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    from web.core.database import engine
+
+    client = await api_client()
+    try:
+        tasks = payloads(count)
+
+        start = time.perf_counter()
+        single_ids = []
+        for task in tasks:
+            response = await client.post("/tasks/", json=task)
+            response.raise_for_status()
+            single_ids.append(response.json()["id"])
+        report("POST /tasks (one by one)", count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        bulk_ids = []
+        for offset in range(0, count, batch_size):
+            response = await client.post("/tasks/bulk", json=tasks[offset:offset + batch_size])
+            response.raise_for_status()
+            bulk_ids.extend(task["id"] for task in response.json()["tasks"])
+        report(f"POST /tasks/bulk ({batch_size}/req)", count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for task_id, task in zip(single_ids, tasks):
+            response = await client.put(f"/tasks/{task_id}", json={**task, "status": "completed"})
+            response.raise_for_status()
+        report("PUT /tasks/{id} (one by one)", count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for offset in range(0, count, batch_size):
+            items = [{"id": task_id, "status": "completed"} for task_id in bulk_ids[offset:offset + batch_size]]
+            response = await client.patch("/tasks/bulk", json=items)
+            response.raise_for_status()
+        report(f"PATCH /tasks/bulk ({batch_size}/req)", count, time.perf_counter() - start)
+    finally:
+        await client.aclose()
+        await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""Measures GET /tasks serialization on a seeded dataset: the previous ORM + response_model path against the
+column rows + TypeAdapter path, with and without gzip.
+
+Run from the repository root: python benchmarks/list_benchmark.py [tasks] [page size] [seconds per case]
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+DB_FILE = os.path.join(tempfile.mkdtemp(prefix="smtt-bench-"), "list.db")
+os.environ.setdefault("DB_URL", f"sqlite+aiosqlite:///{DB_FILE}")
+
+# seed puts the repository on sys.path and fills the settings environment, so it is imported first
+from seed import api_client, seed_sync
+
+from typing import List
+from fastapi import Depends
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from web.core.deps import get_current_user, get_session
+from web.main import app
+from web.models.task_model import TaskModel
+from web.repositories.task_repository import build_tasks_query, get_tasks
+from web.schemas.task_schema import TaskListAdapter, TaskResponseSchema
+
+# The list endpoint as it was before: ORM objects validated one by one through response_model
+@app.get("/api/v1/benchmark/legacy-tasks", response_model=List[TaskResponseSchema], dependencies=[Depends(get_current_user)])
+async def legacy_tasks_endpoint(limit: int = 100, db: AsyncSession = Depends(get_session)):
+    result = await db.execute(build_tasks_query(None, None, limit))
+    return result.scalars().all()[:limit]
+
+def legacy_serialize(tasks):
+    return json.dumps([TaskResponseSchema.model_validate(task).model_dump(mode="json") for task in tasks]).encode()
+
+def adapter_serialize(rows):
+    return TaskListAdapter.dump_json(TaskListAdapter.validate_python(rows))
+
+def time_per_call(function, argument, seconds):
+    calls, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        function(argument)
+        calls += 1
+    return (time.perf_counter() - start) / calls
+
+async def requests_per_second(client, path, seconds, headers=None):
+    count, size, start = 0, 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        response = await client.get(path, headers=headers)
+        response.raise_for_status()
+        size = int(response.headers.get("content-length", len(response.content)))
+        count += 1
+    return count / (time.perf_counter() - start), size
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    page = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 3.0
+    from web.core.database import Session, engine
+
+    with create_engine(f"sqlite:///{DB_FILE}").begin() as connection:
+        seed_sync(connection, count)
+
+    async with Session() as db:
+        tasks = (await db.execute(select(TaskModel).limit(page))).scalars().all()
+        rows, _ = await get_tasks(db, None, None, page)
+    legacy = time_per_call(legacy_serialize, tasks, seconds)
+    adapter = time_per_call(adapter_serialize, rows, seconds)
+    print(f"serialize {page} tasks: model_validate + json.dumps {legacy * 1000:6.2f} ms, "
+          f"TypeAdapter.dump_json {adapter * 1000:6.2f} ms ({legacy / adapter:.1f}x)")
+
+    client = await api_client()
+    try:
+        cases = [
+            ("before: ORM + response_model", f"/benchmark/legacy-tasks?limit={page}", {"Accept-Encoding": "identity"}),
+            ("after: rows + TypeAdapter", f"/tasks/?limit={page}", {"Accept-Encoding": "identity"}),
+            ("after: rows + TypeAdapter + gzip", f"/tasks/?limit={page}", {"Accept-Encoding": "gzip"}),
+        ]
+        for label, path, headers in cases:
+            rate, size = await requests_per_second(client, path, seconds, headers)
+            print(f"GET {page}/{count} tasks {label:<34} {rate:8.1f} req/s  {size / 1024:8.1f} KiB")
+    finally:
+        await client.aclose()
+        await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+"""Seeds a large SQLite task table and checks with EXPLAIN QUERY PLAN that list/filter queries use the TaskModel indexes.
+
+Run from the repository root: python benchmarks/query_plans.py [rows]
+Exits with status 1 when a query falls back to a full scan or a sort the indexes should have avoided.
+"""
+import sys
+
+# seed puts the repository on sys.path and fills the settings environment, so it is imported first
+from seed import seed_sync
+
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine, event, text
+from web.core.pagination import encode_cursor
+from web.models.task_model import TaskPriority, TaskStatus
+from web.repositories.task_repository import build_tasks_query
+from web.schemas.task_schema import TaskFilterSchema
+
+NOW = datetime.now(timezone.utc)
+
+# (description, filters, cursor, acceptable indexes, sort allowed)
+CASES = [
+    ("list newest first", None, None, ("ix_tasks_created_at_id",), False),
+    ("list next page", None, encode_cursor(NOW - timedelta(days=1), 10**9), ("ix_tasks_created_at_id",), False),
+    ("filter by status", TaskFilterSchema(status=TaskStatus.PENDING), None, ("ix_tasks_status_created_at_id",), False),
+    ("filter by priority", TaskFilterSchema(priority=TaskPriority.URGENT), None, ("ix_tasks_priority_created_at_id",), False),
+    ("assignee board", TaskFilterSchema(assigneeId=3, status=TaskStatus.IN_PROGRESS), None, ("ix_tasks_assignee_status_due",), True),
+    ("due range", TaskFilterSchema(assigneeId=3, due_from=NOW, due_to=NOW + timedelta(days=7)), None, ("ix_tasks_assignee_status_due", "ix_tasks_due_datetime"), True),
+]
+
+def query_plan(connection, query):
+    # Prefixing the statement at cursor level keeps SQLAlchemy's own parameter processing (enums, datetimes)
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        return f"EXPLAIN QUERY PLAN {statement}", parameters
+
+    event.listen(connection, "before_cursor_execute", explain, retval=True)
+    try:
+        return [row[-1] for row in connection.execute(query).all()]
+    finally:
+        event.remove(connection, "before_cursor_execute", explain)
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    engine = create_engine("sqlite://")
+    failures = 0
+
+    with engine.begin() as connection:
+        seed_sync(connection, row_count)
+        connection.execute(text("ANALYZE"))
+
+        for description, filters, cursor, indexes, sort_allowed in CASES:
+            plan = query_plan(connection, build_tasks_query(filters, cursor, 100))
+            uses_index = any(index in step for step in plan for index in indexes)
+            sorts = any("TEMP B-TREE" in step for step in plan)
+            ok = uses_index and (sort_allowed or not sorts)
+            failures += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {description:<20} {' | '.join(plan)}")
+
+    print(f"{len(CASES) - failures}/{len(CASES)} query plans use their index ({row_count} rows)")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compares escpos' image() conversion with the NumPy raster stage and its cache, in speed and in output.
+
+Run from the repository root: python benchmarks/raster_benchmark.py
+Exits with status 1 when the default dither mode does not produce the exact bytes image() sends.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "cli", "src"))
+
+import escpos.printer as es
+from device.raster import RasterCache, encode_raster
+from utils.settings import RASTER_DITHER
+from ticket.native_renderer import render_ticket
+
+TICKET = {
+    "emoji": "🚨",
+    "urgency": "Urgente",
+    "task": "Revisar o relatório semanal de vendas antes da reunião",
+    "due_date": "20/10/2026",
+    "due_hour": "14:00",
+}
+
+def measure(label, function, rounds=200):
+    function()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    elapsed_ms = (time.perf_counter() - start) / rounds * 1000
+    print(f"{label:<32} {elapsed_ms:8.3f} ms/ticket")
+    return elapsed_ms
+
+def reference_output(image):
+    printer = es.Dummy()
+    printer.image(image)
+    return printer.output
+
+def compare_output(image):
+    """Bytes of each dither mode that differ from what image() sends for the same rendered ticket."""
+    reference = reference_output(image)
+    differences = {}
+    for dither in ("threshold", "ordered", "floyd"):
+        raster = encode_raster(image, dither)
+        differing = sum(a != b for a, b in zip(reference, raster)) + abs(len(reference) - len(raster))
+        differences[dither] = differing
+        print(f"{dither:<10} {differing:6d} of {len(reference)} bytes differ from image()")
+    return differences
+
+def main():
+    # A real ticket: anti-aliased text and a colour emoji, not just pure black and white
+    image = render_ticket(TICKET)
+    image.info["render_key"] = "benchmark"
+
+    differences = compare_output(image)
+
+    baseline = measure("escpos image()", lambda: es.Dummy().image(image))
+    for dither in ("threshold", "ordered", "floyd"):
+        measure(f"numpy encode ({dither})", lambda: encode_raster(image, dither))
+
+    cache = RasterCache()
+    cached = measure("cached raster (reprint)", lambda: cache.get_raster(image))
+    print(f"reprint speedup vs image(): {baseline / cached:.0f}x")
+
+    if differences[RASTER_DITHER]:
+        print(f"The default dither mode '{RASTER_DITHER}' does not match image()")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
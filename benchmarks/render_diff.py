@@ -0,0 +1,122 @@
+"""Pixel diff of the native Pillow renderer against the HTML template rendered by the headless browser.
+
+Run from the repository root: python benchmarks/render_diff.py
+Exits with status 1 when any sample ticket has more differing pixels than --tolerance allows.
+
+Pixels are compared as the printer sees them (ink where the grey level is below 128), so anti-aliasing shades
+that print the same do not count. Differing pixels are counted against the ink of the HTML render rather than the
+whole ticket: ink covers a few percent of a ticket, so a ratio of all pixels would let a missing line pass. Without a browser, compare against PNGs saved earlier by the HTML backend:
+
+    python benchmarks/render_diff.py --save-reference benchmarks/render_reference   # where Chrome is installed
+    python benchmarks/render_diff.py --reference benchmarks/render_reference
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "cli", "src"))
+
+import numpy as np
+from PIL import Image
+from ticket.html_generator import fill_template
+from ticket.native_renderer import render_ticket
+from utils.settings import TICKET_SIZE
+
+# One ticket per urgency, plus the layouts most likely to drift: long wrapping text and empty due fields
+SAMPLE_TICKETS = {
+    "urgente": {"emoji": "🚨", "urgency": "Urgente", "task": "Fechar o relatório mensal", "due_date": "20/10/2026", "due_hour": "10:00"},
+    "alta": {"emoji": "⚠️", "urgency": "Alta", "task": "Responder os e-mails dos clientes", "due_date": "21/10/2026", "due_hour": "12:30"},
+    "media": {"emoji": "❗", "urgency": "Média", "task": "Atualizar a planilha de custos", "due_date": "22/10/2026", "due_hour": "16:00"},
+    "baixa": {"emoji": "🐢", "urgency": "Baixa", "task": "Organizar a mesa", "due_date": "24/10/2026", "due_hour": "18:00"},
+    "concluida": {"emoji": "✅", "urgency": "Concluída", "task": "Enviar a proposta", "due_date": "", "due_hour": ""},
+    "long_task": {
+        "emoji": "🚨",
+        "urgency": "Urgente",
+        "task": "Revisar o relatório semanal de vendas antes da reunião com a diretoria e enviar as correções",
+        "due_date": "20/10/2026",
+        "due_hour": "14:00",
+    },
+}
+
+def render_html(ticket_data):
+    # Imported here: the pool needs html2image and a browser, which --reference runs do without
+    from ticket.render_pool import get_render_pool
+    return get_render_pool().render(fill_template(ticket_data))
+
+def load_reference(directory, name):
+    path = os.path.join(directory, f"{name}.png")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No reference image {path}, create it with --save-reference")
+    with Image.open(path) as image:
+        return image.convert("RGB")
+
+def ink(image):
+    # Both renders are laid on the same canvas so a height difference counts as differing pixels
+    canvas = Image.new("RGB", TICKET_SIZE, "white")
+    canvas.paste(image.convert("RGB"), (0, 0))
+    return np.asarray(canvas.convert("L")) < 128
+
+def diff_image(expected, actual, mismatch):
+    """HTML render, native render and the differing pixels in red, side by side."""
+    width, height = TICKET_SIZE
+    overlay = np.full((height, width, 3), 255, dtype=np.uint8)
+    overlay[expected & actual] = (160, 160, 160)
+    overlay[mismatch] = (255, 0, 0)
+
+    sheet = Image.new("RGB", (width * 3, height), "white")
+    for index, part in enumerate((Image.fromarray(~expected), Image.fromarray(~actual), Image.fromarray(overlay))):
+        sheet.paste(part.convert("RGB"), (width * index, 0))
+    return sheet
+
+def compare(name, ticket_data, args):
+    if args.reference:
+        expected_image = load_reference(args.reference, name)
+    else:
+        expected_image = render_html(ticket_data)
+        if args.save_reference:
+            expected_image.save(os.path.join(args.save_reference, f"{name}.png"))
+
+    expected = ink(expected_image)
+    actual = ink(render_ticket(ticket_data))
+    mismatch = expected != actual
+    ratio = mismatch.sum() / max(expected.sum(), 1)
+
+    if args.output:
+        diff_image(expected, actual, mismatch).save(os.path.join(args.output, f"{name}.png"))
+    return ratio
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pixel diff of the native renderer against the HTML renderer")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="highest differing pixels per ink pixel of the HTML render")
+    parser.add_argument("--reference", help="compare against PNGs in this directory instead of rendering HTML")
+    parser.add_argument("--save-reference", help="save the HTML renders as PNGs in this directory")
+    parser.add_argument("--output", help="write HTML | native | diff sheets as PNGs in this directory")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    for directory in (args.save_reference, args.output):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    failed = []
+    for name, ticket_data in SAMPLE_TICKETS.items():
+        try:
+            ratio = compare(name, ticket_data, args)
+        except Exception as e:
+            print(f"{name:<12} error: {e}")
+            failed.append(name)
+            continue
+
+        verdict = "ok" if ratio <= args.tolerance else "FAIL"
+        print(f"{name:<12} {ratio:8.2%} of the reference ink differs  {verdict}")
+        if ratio > args.tolerance:
+            failed.append(name)
+
+    if failed:
+        print(f"{len(failed)} of {len(SAMPLE_TICKETS)} tickets exceed {args.tolerance:.2%} or could not be compared")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Shared helpers for the benchmarks: environment defaults for web.core.config and a seeded task table."""
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "cli", "src"))
+
+# Settings has required fields; benchmarks only need placeholders unless the caller exported real values
+os.environ.setdefault("DB_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+os.environ.setdefault("JWT_EXPIRATION", "60")
+os.environ.setdefault("ALLOWED_ORIGINS", '["http://localhost"]')
+
+WORDS = (
+    "relatório reunião cliente orçamento entrega revisar enviar comprar pagar agendar médico contrato "
+    "fatura projeto apresentação planilha backup servidor viagem escola mercado banco imposto"
+).split()
+
+def task_rows(count, users=20, seed=42):
+    from web.models.task_model import TaskCategory, TaskPriority, TaskStatus
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    statuses, priorities, categories = list(TaskStatus), list(TaskPriority), list(TaskCategory)
+    rows = []
+    for index in range(count):
+        created_at = now - timedelta(minutes=count - index)
+        rows.append({
+            "title": " ".join(rng.choices(WORDS, k=4)),
+            "description": " ".join(rng.choices(WORDS, k=12)),
+            "due_datetime": created_at + timedelta(days=rng.randint(-10, 30)) if rng.random() < 0.9 else None,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "status": rng.choice(statuses),
+            "priority": rng.choice(priorities),
+            "category": rng.choice(categories),
+            "assigneeId": rng.randint(1, users),
+        })
+    return rows
+
+def seed_sync(connection, count, users=20, chunk=5000):
+    """Creates the schema on a synchronous connection and inserts `users` users and `count` tasks."""
+    from web.core.config import settings
+    from web.models.task_model import TaskModel
+    from web.models.user_model import UserModel
+    from web.utils.create_tables import create_missing_indexes
+    import web.models.__all_models  # noqa: F401
+
+    settings.DBBaseModel.metadata.create_all(connection)
+    create_missing_indexes(connection)
+
+    now = datetime.now(timezone.utc)
+    connection.execute(UserModel.__table__.insert(), [
+        {"name": f"User {index}", "email": f"user{index}@example.com", "password": "x", "is_active": True,
+         "is_admin": False, "created_at": now, "updated_at": now}
+        for index in range(1, users + 1)
+    ])
+    rows = task_rows(count, users)
+    for start in range(0, count, chunk):
+        connection.execute(TaskModel.__table__.insert(), rows[start:start + chunk])
+
+async def api_client(email="benchmark@example.com", password="benchmark"):
+    """Creates the schema, registers and logs in a user, and returns an httpx client bound to the ASGI app.
+
+    Requests go through the whole FastAPI stack (routing, auth, validation, serialization) without a socket.
+    """
+    import httpx
+    from web.main import app
+    from web.utils.create_tables import create_tables
+
+    await create_tables()
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark/api/v1")
+    await client.post("/auth/register", json={"name": "Benchmark", "email": email, "password": password, "confirm_password": password})
+    response = await client.post("/auth/login", data={"username": email, "password": password})
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+    return client
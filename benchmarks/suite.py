@@ -0,0 +1,244 @@
+"""Benchmark suite for the API, the ticket renderer and the print path, with JSON results to compare commits.
+
+Run from the repository root:
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --output after.json
+    python benchmarks/suite.py --compare before.json after.json
+
+The API runs in process against a seeded SQLite file through httpx' ASGI transport, and printing goes to
+escpos' Dummy printer, so results depend on the code and the machine but not on the network or a device.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+DB_FILE = os.path.join(tempfile.mkdtemp(prefix="smtt-bench-"), "suite.db")
+os.environ.setdefault("DB_URL", f"sqlite+aiosqlite:///{DB_FILE}")
+# Rendered tickets are not written to disk during the run
+os.environ.setdefault("SMTT_PERSIST_TICKETS", "0")
+
+# seed puts the repository on sys.path and fills the settings environment, so it is imported first
+from seed import ROOT, api_client, seed_sync
+
+TASK = {
+    "title": "Revisar o relatório semanal",
+    "description": "Conferir números com o time de vendas",
+    "due_datetime": "2026-10-20T14:00:00Z",
+    "status": "pending",
+    "priority": "high",
+    "category": "work",
+    "assigneeId": 1,
+}
+
+def summarize(samples, wall=None):
+    """Latency percentiles in milliseconds and throughput for a list of per-operation durations in seconds."""
+    ordered = sorted(samples)
+
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))] * 1000
+
+    wall = wall if wall is not None else sum(samples)
+    return {
+        "count": len(samples),
+        "mean_ms": sum(samples) / len(samples) * 1000,
+        "p50_ms": percentile(50),
+        "p90_ms": percentile(90),
+        "p99_ms": percentile(99),
+        "max_ms": ordered[-1] * 1000,
+        "ops_per_sec": len(samples) / wall if wall else 0.0,
+    }
+
+async def timed_requests(requests):
+    samples = []
+    for send in requests:
+        start = time.perf_counter()
+        response = await send()
+        samples.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return samples
+
+async def api_benchmarks(args):
+    from web.core.database import engine
+
+    client = await api_client()
+    results = {}
+    try:
+        ids = list(range(1, args.tasks + 1))
+        rng = random.Random(7)
+        n = args.iterations
+
+        login = {"username": "benchmark@example.com", "password": "benchmark"}
+        results["api.login"] = summarize(await timed_requests(
+            [lambda: client.post("/auth/login", data=login)] * max(n // 10, 5)
+        ))
+        results["api.list"] = summarize(await timed_requests(
+            [lambda: client.get("/tasks/", params={"limit": args.page})] * n
+        ))
+        results["api.get"] = summarize(await timed_requests(
+            [lambda task_id=rng.choice(ids): client.get(f"/tasks/{task_id}") for _ in range(n)]
+        ))
+
+        created = []
+
+        async def create():
+            response = await client.post("/tasks/", json=TASK)
+            created.append(response.json().get("id"))
+            return response
+
+        results["api.create"] = summarize(await timed_requests([create] * n))
+        results["api.update"] = summarize(await timed_requests(
+            [lambda task_id=task_id: client.put(f"/tasks/{task_id}", json={**TASK, "status": "completed"}) for task_id in created]
+        ))
+        results["api.delete"] = summarize(await timed_requests(
+            [lambda task_id=task_id: client.delete(f"/tasks/{task_id}") for task_id in created]
+        ))
+
+        # Throughput with several clients in flight, latency then includes queueing on the event loop and pool
+        async def worker(count):
+            return await timed_requests([lambda: client.get("/tasks/", params={"limit": args.page})] * count)
+
+        start = time.perf_counter()
+        batches = await asyncio.gather(*(worker(max(n // args.concurrency, 1)) for _ in range(args.concurrency)))
+        results[f"api.list_concurrent_{args.concurrency}"] = summarize(
+            [sample for batch in batches for sample in batch], time.perf_counter() - start
+        )
+    finally:
+        await client.aclose()
+        await engine.dispose()
+    return results
+
+def timed_calls(function, arguments):
+    samples = []
+    for argument in arguments:
+        start = time.perf_counter()
+        function(argument)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def ticket(index):
+    return {
+        "emoji": "⚠️",
+        "urgency": "Alta",
+        "task": f"Revisar o relatório semanal de vendas #{index}",
+        "due_date": "20/10/2026",
+        "due_hour": "14:00",
+    }
+
+def cli_benchmarks(args):
+    import escpos.printer as es
+    from device.raster import encode_raster
+    from device.spooler import PrintSpooler
+    from ticket.html_generator import fill_template, generate_ticket
+
+    n = args.iterations
+    results = {}
+    tickets = [ticket(index) for index in range(n)]
+
+    results["render.fill_template"] = summarize(timed_calls(fill_template, tickets))
+    # Distinct tickets miss the render cache, rendering them again measures the cache hit path
+    images = []
+    results["render.generate_ticket"] = summarize(timed_calls(lambda data: images.append(generate_ticket(data, "native")), tickets))
+    results["render.generate_ticket_cached"] = summarize(timed_calls(lambda data: generate_ticket(data, "native"), tickets))
+    results["print.encode_raster"] = summarize(timed_calls(encode_raster, images))
+
+    spooler = PrintSpooler(printer_factory=es.Dummy)
+    try:
+        results["print.spooler_dummy"] = summarize(timed_calls(lambda image: spooler.submit_image(image, block=True).wait(), images))
+        results["print.spooler_dummy_reprint"] = summarize(timed_calls(lambda image: spooler.submit_image(image, block=True).wait(), images))
+    finally:
+        spooler.stop()
+    return results
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(args):
+    from sqlalchemy import create_engine
+
+    with create_engine(f"sqlite:///{DB_FILE}").begin() as connection:
+        seed_sync(connection, args.tasks)
+
+    results = {}
+    # stdout is reserved for the JSON report, progress and banners printed by the app go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        if "api" in args.only:
+            results.update(asyncio.run(api_benchmarks(args)))
+        if "cli" in args.only:
+            results.update(cli_benchmarks(args))
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "tasks": args.tasks,
+            "iterations": args.iterations,
+            "page": args.page,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+    for name, stats in results.items():
+        print(
+            f"{name:<34} p50 {stats['p50_ms']:8.2f} ms  p90 {stats['p90_ms']:8.2f} ms  "
+            f"p99 {stats['p99_ms']:8.2f} ms  {stats['ops_per_sec']:9.1f} ops/s",
+            file=sys.stderr,
+        )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+def compare(before_path, after_path):
+    with open(before_path, encoding="utf-8") as file:
+        before = json.load(file)
+    with open(after_path, encoding="utf-8") as file:
+        after = json.load(file)
+
+    print(f"{'benchmark':<34} {'p50 before':>11} {'p50 after':>11} {'change':>8}   ({before['meta']['commit']} -> {after['meta']['commit']})")
+    for name in sorted(set(before["results"]) | set(after["results"])):
+        old, new = before["results"].get(name), after["results"].get(name)
+        if old is None or new is None:
+            old_p50 = "-" if old is None else f"{old['p50_ms']:.2f}"
+            new_p50 = "-" if new is None else f"{new['p50_ms']:.2f}"
+            print(f"{name:<34} {old_p50:>11} {new_p50:>11}")
+            continue
+        change = (new["p50_ms"] - old["p50_ms"]) / old["p50_ms"] * 100 if old["p50_ms"] else 0.0
+        print(f"{name:<34} {old['p50_ms']:11.2f} {new['p50_ms']:11.2f} {change:+7.1f}%")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Show Me The Tickets benchmark suite")
+    parser.add_argument("--tasks", type=int, default=10_000, help="tasks seeded before the API benchmarks")
+    parser.add_argument("--iterations", type=int, default=200, help="operations measured per benchmark")
+    parser.add_argument("--page", type=int, default=100, help="page size for the list benchmarks")
+    parser.add_argument("--concurrency", type=int, default=8, help="clients in flight for the concurrent list benchmark")
+    parser.add_argument("--only", nargs="+", choices=["api", "cli"], default=["api", "cli"])
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two JSON reports and exit")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.compare:
+        compare(*args.compare)
+    else:
+        run(args)
@@ -0,0 +1,45 @@
+import json
+import socket
+from utils.settings import DAEMON_CLIENT_TIMEOUT, DAEMON_SOCKET
+
+# Kept free of rendering, printer and colorama imports: a `send` pays for the interpreter and this module only
+
+class DaemonUnavailable(Exception):
+    pass
+
+def unix_sockets_available():
+    return hasattr(socket, "AF_UNIX")
+
+def request(payload, path=DAEMON_SOCKET, timeout=DAEMON_CLIENT_TIMEOUT):
+    """Sends one JSON request line to the daemon and returns its decoded JSON answer."""
+    if not unix_sockets_available():
+        raise DaemonUnavailable("The daemon needs Unix sockets, which this platform does not provide")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        try:
+            connection.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise DaemonUnavailable(f"No daemon is listening on {path}, start one with `main.py daemon`")
+
+        connection.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+        with connection.makefile("rb") as answers:
+            answer = answers.readline()
+
+    if not answer:
+        raise DaemonUnavailable("The daemon closed the connection without answering")
+    return json.loads(answer)
+
+def run_client(payload):
+    """Runs one request for the `send`/`reprint`/`daemon --stop` commands and returns the process exit code."""
+    try:
+        answer = request(payload)
+    except (DaemonUnavailable, OSError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    if not answer.get("ok"):
+        print(f"Error: {answer.get('error')}")
+        return 1
+    print(answer.get("message", "OK"))
+    return 0
@@ -0,0 +1,133 @@
+import json
+import os
+import queue
+import socketserver
+import threading
+from daemon.client import DaemonUnavailable, request
+from device.raster import get_raster_cache
+from device.spooler import DONE, get_spooler, report_finished_jobs, stop_spooler
+from ticket.batch import ticket_from_row
+from ticket.create_new_ticket import queue_ticket
+from ticket.html_generator import generate_ticket
+from ticket.list_tickets import requeue_ticket
+from ticket.ticket_store import get_ticket_store
+from utils.settings import DAEMON_SOCKET, DAEMON_TIMEOUT, RENDER_BACKEND
+from utils.visuals import print_error, print_success
+
+WARMUP_TICKET = {"emoji": "✅", "urgency": "Concluída", "task": "Show Me The Tickets", "due_date": "", "due_hour": ""}
+
+class TicketRequestHandler(socketserver.StreamRequestHandler):
+    """One JSON request per line, answered with one JSON line; a client may send several on one connection."""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                answer = self.server.dispatch(json.loads(line))
+            except queue.Full:
+                answer = {"ok": False, "error": "The print queue is full. Please wait for the printer and try again."}
+            except Exception as e:
+                answer = {"ok": False, "error": str(e)}
+            self.wfile.write(json.dumps(answer, ensure_ascii=False).encode("utf-8") + b"\n")
+
+class TicketDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Long-running process that keeps the imports, renderer, caches and printer connection of the CLI warm.
+
+    Tickets arrive over a Unix socket from `main.py send`, so creating one costs a render and a queue
+    put instead of a fresh interpreter importing escpos and setting up rendering.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path=DAEMON_SOCKET, backend=RENDER_BACKEND):
+        self.path = path
+        self.backend = backend
+        # Renderers share fonts and caches, tickets from concurrent clients are rendered one at a time
+        self.render_lock = threading.Lock()
+        remove_stale_socket(path)
+        super().__init__(path, TicketRequestHandler)
+        os.chmod(path, 0o600)
+
+    def warm_up(self):
+        # First render loads fonts (or starts the headless browsers) and the first encode pays numpy's setup
+        image = generate_ticket(WARMUP_TICKET, self.backend)
+        if image is None:
+            # generate_ticket has printed why; tickets are still accepted and report their own render errors
+            print_error("Warm-up render failed, the daemon starts cold")
+        else:
+            get_raster_cache().get_raster(image)
+        get_spooler()
+        get_ticket_store()
+
+    def dispatch(self, payload):
+        match payload.get("command"):
+            case "ping":
+                return {"ok": True, "message": f"Daemon {os.getpid()} is running on {self.path}"}
+            case "ticket":
+                if not (payload.get("ticket") or {}).get("task"):
+                    raise ValueError("The ticket has no task")
+                ticket_data = ticket_from_row(payload["ticket"])
+                with self.render_lock:
+                    job, ticket_id = queue_ticket(ticket_data, self.backend)
+                return self.answer_job(job, ticket_id, payload.get("wait"))
+            case "reprint":
+                ticket_id = int(payload.get("id"))
+                job = requeue_ticket(ticket_id)
+                return self.answer_job(job, ticket_id, payload.get("wait"))
+            case "stop":
+                # shutdown() blocks until serve_forever returns, so it cannot run on this handler's answer path
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                return {"ok": True, "message": "Daemon stopping"}
+            case command:
+                raise ValueError(f"Unknown command '{command}'")
+
+    def answer_job(self, job, ticket_id, wait):
+        stored = f"ID {ticket_id}" if ticket_id is not None else "not saved"
+        if not wait:
+            return {"ok": True, "job": job.id, "ticket_id": ticket_id, "message": f"Ticket #{job.id} queued ({stored})"}
+
+        job.wait(DAEMON_TIMEOUT)
+        if job.status != DONE:
+            return {"ok": False, "job": job.id, "ticket_id": ticket_id, "error": job.error or f"Ticket #{job.id} is still {job.status}"}
+        return {"ok": True, "job": job.id, "ticket_id": ticket_id, "message": f"Ticket #{job.id} printed ({stored})"}
+
+    def service_actions(self):
+        # Called by serve_forever between requests; also keeps the spooler's finished job list from growing
+        report_finished_jobs()
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+def remove_stale_socket(path):
+    if not os.path.exists(path):
+        return
+    try:
+        request({"command": "ping"}, path, timeout=1)
+    except (DaemonUnavailable, OSError):
+        # Left behind by a daemon that did not exit cleanly
+        os.remove(path)
+        return
+    raise RuntimeError(f"A daemon is already running on {path}")
+
+def run_daemon(backend=RENDER_BACKEND):
+    """Serves until stopped and returns the process exit code, 1 when the daemon could not start."""
+    try:
+        server = TicketDaemon(backend=backend)
+    except (OSError, RuntimeError) as e:
+        print_error(f"Could not start the daemon: {e}")
+        return 1
+
+    with server:
+        server.warm_up()
+        print_success(f"Daemon ready on {server.path}, press Ctrl+C to stop")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    # Tickets still in the spooler are printed before leaving
+    stop_spooler()
+    report_finished_jobs()
+    return 0
@@ -1,13 +1,28 @@
 import escpos.printer as es
+from device.raster import get_raster_cache
+from utils.profiling import stage
+from utils.settings import PRINTER_FILE, PRINTER_PRODUCT_ID, PRINTER_VENDOR_ID
 from utils.visuals import print_error, print_success
 
-def print_image_ticket(image_path):
+def connect_printer():
+    if PRINTER_FILE:
+        return es.File(PRINTER_FILE)
+    return es.Usb(PRINTER_VENDOR_ID, PRINTER_PRODUCT_ID, timeout=0)
+
+def send_raster(printer_instance, raster):
+    # escpos has no public call for pre-built command streams; _raw is what image() itself writes through
+    printer_instance._raw(raster)
+
+def print_image_ticket(image):
     printer_instance = None
     try:
-        printer_instance = es.Usb(0x0416,0x5011, timeout=0)
+        with stage("printer.connect"):
+            printer_instance = connect_printer()
         
-        printer_instance.image(image_path)
-        printer_instance.cut()
+        raster = get_raster_cache().get_raster(image)
+        with stage("printer.transfer"):
+            send_raster(printer_instance, raster)
+            printer_instance.cut()
         print_success("Successfully sent the ticket to thermal printer!")
     
     except Exception as e:
@@ -20,7 +35,7 @@ def print_image_ticket(image_path):
 def print_simple_text_ticket(text):
     printer_instance = None
     try:
-        printer_instance = es.Usb(0x0416,0x5011, timeout=0)
+        printer_instance = connect_printer()
         
         printer_instance.text(text)
         printer_instance.cut()
@@ -31,4 +46,4 @@ def print_simple_text_ticket(text):
     
     finally:
         if printer_instance:
-            printer_instance.close()
\ No newline at end of file
+            printer_instance.close()
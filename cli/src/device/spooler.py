@@ -0,0 +1,193 @@
+import atexit
+import itertools
+import queue
+import threading
+import time
+from collections import OrderedDict
+from device.printer import connect_printer, send_raster
+from device.raster import get_raster_cache
+from utils.profiling import stage
+from utils.settings import PRINT_BACKOFF_INITIAL, PRINT_BACKOFF_MAX, PRINT_MAX_ATTEMPTS, PRINT_QUEUE_SIZE
+from utils.visuals import print_error, print_success
+
+QUEUED = "queued"
+PRINTING = "printing"
+DONE = "done"
+FAILED = "failed"
+
+FINISHED_JOBS_KEPT = 500
+
+class PrintJob:
+    def __init__(self, job_id, kind, payload):
+        self.id = job_id
+        self.kind = kind
+        self.payload = payload
+        self.status = QUEUED
+        self.error = None
+        self.attempts = 0
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self.finished = threading.Event()
+
+    def wait(self, timeout=None):
+        return self.finished.wait(timeout)
+
+class PrintSpooler:
+    """Background worker that owns one long-lived printer connection and prints queued jobs in order.
+
+    A failed transfer drops the connection and retries the job on a fresh one, backing off exponentially
+    between attempts. `printer_factory` can return escpos `Dummy`/`File` printers for tests and dry runs.
+    """
+
+    def __init__(
+        self,
+        printer_factory=connect_printer,
+        max_queue=PRINT_QUEUE_SIZE,
+        max_attempts=PRINT_MAX_ATTEMPTS,
+        backoff_initial=PRINT_BACKOFF_INITIAL,
+        backoff_max=PRINT_BACKOFF_MAX,
+    ):
+        self.printer_factory = printer_factory
+        self.max_attempts = max(max_attempts, 1)
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.printer = None
+        self.jobs = OrderedDict()
+        self.unreported = []
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.stopped = False
+        self.worker = threading.Thread(target=self._work, name="print-spooler", daemon=True)
+        self.worker.start()
+
+    def submit(self, kind, payload, block=False, timeout=None):
+        with self.lock:
+            if self.stopped:
+                raise RuntimeError("The print spooler has been stopped")
+            job = PrintJob(next(self.ids), kind, payload)
+            self.jobs[job.id] = job
+        try:
+            # A full queue raises queue.Full instead of stalling the caller, unless it asks to block
+            self.queue.put(job, block=block, timeout=timeout)
+        except queue.Full:
+            with self.lock:
+                del self.jobs[job.id]
+            raise
+        return job
+
+    def submit_image(self, image, **kwargs):
+        return self.submit("image", image, **kwargs)
+
+    def submit_raster(self, raster, **kwargs):
+        return self.submit("raster", raster, **kwargs)
+
+    def submit_text(self, text, **kwargs):
+        return self.submit("text", text, **kwargs)
+
+    def job(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def pop_finished(self):
+        with self.lock:
+            finished, self.unreported = self.unreported, []
+        return finished
+
+    def stop(self, drain=True, timeout=None):
+        with self.lock:
+            if self.stopped:
+                return
+            self.stopped = True
+        if drain:
+            self.queue.join()
+        self.queue.put(None)
+        self.worker.join(timeout)
+
+    def _work(self):
+        while True:
+            job = self.queue.get()
+            try:
+                if job is None:
+                    self._disconnect()
+                    return
+                self._print(job)
+            finally:
+                self.queue.task_done()
+
+    def _print(self, job):
+        job.status = PRINTING
+        while True:
+            job.attempts += 1
+            try:
+                if self.printer is None:
+                    with stage("printer.connect"):
+                        self.printer = self.printer_factory()
+                self._send(job)
+                job.status = DONE
+                job.error = None
+                break
+            except Exception as e:
+                self._disconnect()
+                job.error = str(e)
+                if job.attempts >= self.max_attempts:
+                    job.status = FAILED
+                    break
+                time.sleep(min(self.backoff_initial * 2 ** (job.attempts - 1), self.backoff_max))
+
+        job.finished_at = time.time()
+        # The payload is not needed once printed; keeping it would pin every ticket image in memory
+        job.payload = None
+        with self.lock:
+            self.unreported.append(job)
+            finished = [job_id for job_id, known in self.jobs.items() if known.finished_at is not None]
+            for job_id in finished[:max(len(finished) - FINISHED_JOBS_KEPT, 0)]:
+                del self.jobs[job_id]
+        job.finished.set()
+
+    def _send(self, job):
+        # Encoding is timed on its own by encode_raster, the transfer stage only covers the printer I/O
+        payload = get_raster_cache().get_raster(job.payload) if job.kind == "image" else job.payload
+
+        with stage("printer.transfer"):
+            match job.kind:
+                case "image" | "raster":
+                    send_raster(self.printer, payload)
+                case "text":
+                    self.printer.text(payload)
+                case _:
+                    raise ValueError(f"Unknown print job kind '{job.kind}'")
+            self.printer.cut()
+
+    def _disconnect(self):
+        if self.printer is not None:
+            try:
+                self.printer.close()
+            except Exception:
+                pass
+            self.printer = None
+
+_spooler = None
+_spooler_lock = threading.Lock()
+
+def get_spooler():
+    global _spooler
+    with _spooler_lock:
+        if _spooler is None:
+            _spooler = PrintSpooler()
+            atexit.register(_spooler.stop)
+        return _spooler
+
+def stop_spooler():
+    if _spooler is not None:
+        _spooler.stop()
+
+def report_finished_jobs():
+    if _spooler is None:
+        return
+
+    for job in _spooler.pop_finished():
+        if job.status == DONE:
+            print_success(f"Successfully sent ticket #{job.id} to thermal printer!")
+        else:
+            print_error(f"Error sending ticket #{job.id} to thermal printer after {job.attempts} attempts: {job.error}")
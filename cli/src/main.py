@@ -1,12 +1,19 @@
-from device.printer import print_image_ticket
-from ticket.create_new_ticket import create_new_ticket
-from utils.visuals import print_banner, print_menu_options
+import argparse
+import sys
+
+# Commands import what they use when they run: `send` must not pay for escpos, Pillow and numpy on every call
 
 def main():
+    from device.spooler import report_finished_jobs, stop_spooler
+    from ticket.create_new_ticket import create_new_ticket
+    from ticket.list_tickets import list_tickets
+    from utils.visuals import print_banner, print_menu_options
+
     program_running = True
     print_banner()
-    
+
     while program_running:
+        report_finished_jobs()
         print_menu_options()
 
         user_choice = input("Enter your choice: ")
@@ -15,13 +22,109 @@ def main():
             case "1":
                 create_new_ticket()
             case "2":
-                print("Listing tickets...")
+                list_tickets()
             case "3":
+                # Tickets still in the spooler are printed before leaving
+                stop_spooler()
+                report_finished_jobs()
                 print("Goodbye!")
                 program_running = False
                 break
             case _:
                 print("Invalid choice. Please try again.")
 
+def batch(args):
+    from device.spooler import stop_spooler
+    from ticket.batch import run_batch
+    from utils.settings import RENDER_BACKEND
+
+    try:
+        run_batch(args.file, backend=args.backend or RENDER_BACKEND, workers=args.workers)
+    finally:
+        # Tickets already queued are printed even when the batch stops early
+        stop_spooler()
+
+def daemon(args):
+    from daemon.client import run_client, unix_sockets_available
+
+    if args.stop:
+        return run_client({"command": "stop"})
+    if args.status:
+        return run_client({"command": "ping"})
+    if not unix_sockets_available():
+        print("Error: the daemon needs Unix sockets, which this platform does not provide")
+        return 1
+
+    from daemon.server import run_daemon
+    from utils.settings import RENDER_BACKEND
+
+    return run_daemon(backend=args.backend or RENDER_BACKEND)
+
+def send(args):
+    from daemon.client import run_client
+
+    ticket = {
+        "emoji": args.emoji,
+        "urgency": args.urgency,
+        "task": args.task,
+        "due_date": args.due_date,
+        "due_hour": args.due_hour,
+    }
+    return run_client({"command": "ticket", "ticket": ticket, "wait": args.wait})
+
+def reprint(args):
+    from daemon.client import run_client
+
+    return run_client({"command": "reprint", "id": args.id, "wait": args.wait})
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Show Me The Tickets")
+    parser.add_argument("--profile", action="store_true", help="Print render and print stage timings on exit")
+    commands = parser.add_subparsers(dest="command")
+
+    batch_parser = commands.add_parser("batch", help="Render and print every ticket of a CSV or JSON file")
+    batch_parser.add_argument("file", help="CSV/JSON rows with emoji, urgency, task, due_date and due_hour")
+    batch_parser.add_argument("--backend", choices=["native", "html"], default=None, help="Render backend")
+    batch_parser.add_argument("--workers", type=int, default=None, help="Render processes, or threads with --backend html (default: CPU count, or SMTT_RENDER_POOL_SIZE)")
+
+    daemon_parser = commands.add_parser("daemon", help="Keep rendering and the printer warm and take tickets over a Unix socket")
+    daemon_parser.add_argument("--backend", choices=["native", "html"], default=None, help="Render backend")
+    daemon_parser.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    daemon_parser.add_argument("--status", action="store_true", help="Check whether a daemon is running")
+
+    send_parser = commands.add_parser("send", help="Create a ticket through the running daemon")
+    send_parser.add_argument("task", help="Task text")
+    send_parser.add_argument("--urgency", default="Média", help="Urgente, Alta, Média, Baixa or Concluída")
+    send_parser.add_argument("--emoji", default="", help="Emoji (default: picked from the urgency)")
+    send_parser.add_argument("--due-date", default="", help="Due date, e.g. 20/10/2026")
+    send_parser.add_argument("--due-hour", default="", help="Due hour, e.g. 14:00")
+    send_parser.add_argument("--wait", action="store_true", help="Return once the ticket is printed")
+
+    reprint_parser = commands.add_parser("reprint", help="Reprint a saved ticket through the running daemon")
+    reprint_parser.add_argument("id", type=int, help="Ticket ID shown by 'List all tickets'")
+    reprint_parser.add_argument("--wait", action="store_true", help="Return once the ticket is printed")
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_args()
+    if args.profile:
+        from utils.profiling import enable_profiling
+        enable_profiling()
+
+    exit_code = 0
+    match args.command:
+        case "batch":
+            batch(args)
+        case "daemon":
+            exit_code = daemon(args)
+        case "send":
+            exit_code = send(args)
+        case "reprint":
+            exit_code = reprint(args)
+        case _:
+            main()
+
+    if args.profile:
+        from utils.profiling import print_profile
+        print_profile()
+    sys.exit(exit_code)
@@ -0,0 +1,169 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from device.raster import encode_raster, get_raster_cache
+from device.spooler import DONE, get_spooler
+from ticket.html_generator import fill_template
+from ticket.native_renderer import render_ticket
+from ticket.render_cache import render_key
+from ticket.render_pool import get_render_pool
+from ticket.ticket_store import get_ticket_store
+from utils.profiling import enable_profiling, merge_samples, profiling_enabled, stage, take_samples
+from utils.settings import GENERATED_DIR, PERSIST_TICKETS, RENDER_BACKEND, RENDER_POOL_SIZE
+from utils.visuals import print_error, print_success
+
+TICKET_FIELDS = ["emoji", "urgency", "task", "due_date", "due_hour"]
+
+# Emoji used when a row only names the urgency, same pairs offered by create_new_ticket
+URGENCY_EMOJIS = {
+    "Urgente": "🚨",
+    "Alta": "⚠️",
+    "Média": "❗",
+    "Baixa": "❌",
+    "Concluída": "✅",
+}
+
+def ticket_from_row(row):
+    """Ticket data for a batch row or daemon request; the emoji is picked from the urgency when missing."""
+    if not row.get("task"):
+        raise ValueError("has no task")
+    ticket_data = {field: str(row.get(field) or "").strip() for field in TICKET_FIELDS}
+    ticket_data["emoji"] = ticket_data["emoji"] or URGENCY_EMOJIS.get(ticket_data["urgency"], "")
+    return ticket_data
+
+def load_ticket_rows(path):
+    match os.path.splitext(path)[1].lower():
+        case ".csv":
+            with open(path, newline="", encoding="utf-8-sig") as file:
+                rows = list(csv.DictReader(file))
+        case ".json":
+            with open(path, encoding="utf-8") as file:
+                rows = json.load(file)
+            if isinstance(rows, dict):
+                rows = rows.get("tickets", [])
+        case _:
+            raise ValueError(f"Unsupported batch file '{path}', use .csv or .json")
+
+    tickets = []
+    for line, row in enumerate(rows, start=1):
+        try:
+            tickets.append(ticket_from_row(row))
+        except ValueError as e:
+            raise ValueError(f"Row {line} {e}")
+    return tickets
+
+def render_batch_ticket(ticket_data, backend=RENDER_BACKEND):
+    html_filled = fill_template(ticket_data)
+    key = render_key(html_filled, backend)
+    with stage(f"render.{backend}"):
+        match backend:
+            case "native":
+                image = render_ticket(ticket_data)
+            case "html":
+                image = get_render_pool().render(html_filled)
+            case _:
+                raise ValueError(f"Unknown render backend '{backend}'")
+
+    # Pool workers exit without running atexit hooks, so persistence is done here instead of by the render cache
+    if PERSIST_TICKETS and not os.path.exists(f"{GENERATED_DIR}/{key}.png"):
+        os.makedirs(GENERATED_DIR, exist_ok=True)
+        image.save(f"{GENERATED_DIR}/{key}.png")
+
+    # Only the encoded raster travels back to the main process, it is a few KB instead of a full RGB image
+    return key, encode_raster(image)
+
+def render_batch_chunk(chunk, backend=RENDER_BACKEND):
+    """Renders a slice of the batch in a pool worker. A ticket that fails is reported, the others still print."""
+    results = []
+    for ticket_data in chunk:
+        try:
+            key, raster = render_batch_ticket(ticket_data, backend)
+            results.append((key, raster, None))
+        except Exception as e:
+            results.append((None, None, str(e) or type(e).__name__))
+    # Stage timings recorded in the worker ride along so --profile covers the whole batch
+    return results, take_samples()
+
+def run_batch(path, backend=RENDER_BACKEND, workers=None):
+    try:
+        tickets = load_ticket_rows(path)
+    except Exception as e:
+        print_error(f"Error reading batch file: {e}")
+        return
+
+    if not tickets:
+        print_error("The batch file has no tickets.")
+        return
+
+    spooler = get_spooler()
+    raster_cache = get_raster_cache()
+    jobs = []
+    records = []
+    render_errors = []
+    rendered_at = []
+    start = time.perf_counter()
+
+    try:
+        if backend == "html":
+            # Chrome already renders in parallel behind the shared render pool; pool workers would each start
+            # their own browsers and exit without the atexit hook that closes them
+            workers = workers or RENDER_POOL_SIZE
+            executor = ThreadPoolExecutor(max_workers=workers)
+        else:
+            # Spawned workers start from a fresh interpreter and must be told to profile, forked ones inherit it
+            workers = workers or os.cpu_count() or 1
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=enable_profiling if profiling_enabled() else None)
+
+        with executor:
+            chunk_size = max(len(tickets) // (workers * 4), 1)
+            chunks = []
+            for index in range(0, len(tickets), chunk_size):
+                chunk = tickets[index:index + chunk_size]
+                future = executor.submit(render_batch_chunk, chunk, backend)
+                # Stamped when the worker finishes, so time spent blocked on a full print queue below is not render time
+                future.add_done_callback(lambda _: rendered_at.append(time.perf_counter()))
+                chunks.append((chunk, future))
+
+            # Chunks are consumed in submission order, so tickets come out of the printer in file order
+            for chunk, future in chunks:
+                try:
+                    results, samples = future.result()
+                except Exception as e:
+                    # The worker process itself died (e.g. killed or out of memory), its whole chunk is lost
+                    results, samples = [(None, None, str(e) or type(e).__name__)] * len(chunk), {}
+                merge_samples(samples)
+
+                for ticket_data, (key, raster, error) in zip(chunk, results):
+                    if error is not None:
+                        render_errors.append((ticket_data, error))
+                        continue
+                    raster_cache.put(key, raster)
+                    jobs.append(spooler.submit_raster(raster, block=True))
+                    records.append((ticket_data, backend, key, raster))
+    finally:
+        try:
+            # One transaction for everything that was queued, even when the batch was interrupted
+            get_ticket_store().record_many(records)
+        except Exception as e:
+            print_error(f"The tickets were queued but could not be saved for reprinting: {e}")
+
+    rendered_in = max(rendered_at, default=time.perf_counter()) - start
+    for job in jobs:
+        job.wait()
+    printed_in = time.perf_counter() - start
+
+    if render_errors:
+        ticket_data, error = render_errors[0]
+        print_error(f"{len(render_errors)} tickets could not be rendered, e.g. '{ticket_data['task']}': {error}")
+    if not jobs:
+        return
+
+    failed = [job for job in jobs if job.status != DONE]
+    print_success(
+        f"Rendered {len(jobs)} tickets in {rendered_in:.2f}s ({len(jobs) / rendered_in:.1f} tickets/sec), "
+        f"printed in {printed_in:.2f}s ({len(jobs) / printed_in:.1f} tickets/sec)"
+    )
+    if failed:
+        print_error(f"{len(failed)} tickets failed to print: {failed[0].error}")
@@ -1,6 +1,10 @@
-from device.printer import print_image_ticket
+import queue
+from device.raster import get_raster_cache
+from device.spooler import get_spooler
 from ticket.html_generator import generate_ticket
-from utils.visuals import print_creating_ticket, print_error
+from ticket.ticket_store import get_ticket_store
+from utils.settings import RENDER_BACKEND
+from utils.visuals import print_creating_ticket, print_error, print_success
 
 def create_new_ticket():
     print_creating_ticket()
@@ -48,7 +52,29 @@ def create_new_ticket():
     }
     
     try:
-        image_file = generate_ticket(ticket_data)
-        print_image_ticket(f"ticket/generated/{image_file}")
+        job, _ = queue_ticket(ticket_data)
+        print_success(f"Ticket #{job.id} queued for printing!")
+    except queue.Full:
+        print_error("The print queue is full. Please wait for the printer and try again.")
     except Exception as e:
         print_error(f"Error creating ticket: {e}")
+
+def queue_ticket(ticket_data, backend=RENDER_BACKEND):
+    """Renders a ticket, queues it on the spooler and records it in the ticket store.
+
+    Returns the spool job and the stored ticket id, which is None when the ticket could not be saved.
+    Raises queue.Full when the print queue is full and RuntimeError when the ticket cannot be rendered.
+    """
+    image = generate_ticket(ticket_data, backend)
+    if image is None:
+        raise RuntimeError("The ticket could not be rendered")
+    # Encoded here rather than in the spooler so the same raster can be stored for reprints
+    raster = get_raster_cache().get_raster(image)
+    job = get_spooler().submit_raster(raster)
+
+    try:
+        ticket_id = get_ticket_store().record(ticket_data, backend, image.info["render_key"], raster)
+    except Exception as e:
+        print_error(f"The ticket was queued but could not be saved for reprinting: {e}")
+        ticket_id = None
+    return job, ticket_id
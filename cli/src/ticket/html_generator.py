@@ -1,20 +1,42 @@
-import uuid
-from html2image import Html2Image
+from ticket.native_renderer import render_ticket
+from ticket.render_cache import get_render_cache, render_key
+from ticket.render_pool import get_render_pool
 from ticket.ticket_html import HTML_TEMPLATE
+from utils.profiling import stage
+from utils.settings import RENDER_BACKEND
 from utils.visuals import print_error
 
-def generate_ticket(ticket_data):
-    try:
+def fill_template(ticket_data):
+    with stage("fill_template"):
         html_filled = HTML_TEMPLATE
 
         for key, value in ticket_data.items():
             html_filled = html_filled.replace(f"{{{{ {key} }}}}", str(value))
-        
-        output_file = f"{uuid.uuid4()}.png"
-        hti = Html2Image(size=(384, 750), output_path="ticket/generated", disable_logging=True)
-        hti.screenshot(html_str=html_filled, save_as=output_file)
-        return output_file
-        
+        return html_filled
+
+def generate_ticket(ticket_data, backend=RENDER_BACKEND):
+    try:
+        html_filled = fill_template(ticket_data)
+        key = render_key(html_filled, backend)
+        render_cache = get_render_cache()
+
+        # Reprints and recurring tasks produce the same filled template, so they never render twice
+        with stage("render.cache"):
+            cached_image = render_cache.get(key)
+        if cached_image is not None:
+            return cached_image
+
+        with stage(f"render.{backend}"):
+            match backend:
+                case "native":
+                    image = render_ticket(ticket_data)
+                case "html":
+                    image = get_render_pool().render(html_filled)
+                case _:
+                    raise ValueError(f"Unknown render backend '{backend}'")
+
+        return render_cache.put(key, image)
+
     except Exception as e:
         print_error(f"Error generating ticket: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,110 @@
+import queue
+from datetime import datetime
+from device.raster import get_raster_cache
+from device.spooler import get_spooler
+from ticket.html_generator import generate_ticket
+from ticket.ticket_store import get_ticket_store
+from utils.settings import TICKET_LIST_PAGE_SIZE
+from utils.visuals import print_dash, print_error, print_success
+
+URGENCY_CHOICES = {
+    "1": "Urgente",
+    "2": "Alta",
+    "3": "Média",
+    "4": "Baixa",
+    "5": "Concluída",
+}
+
+def requeue_ticket(ticket_id):
+    """Queues a stored ticket again from its stored raster. Raises LookupError for unknown ids and queue.Full."""
+    store = get_ticket_store()
+    ticket = store.get(ticket_id)
+    if ticket is None:
+        raise LookupError(f"There is no ticket with ID {ticket_id}")
+
+    raster = store.get_raster(ticket["render_key"])
+    if raster is None:
+        # Only tickets whose raster row went missing are rendered again
+        ticket_data = {field: ticket[field] for field in ("emoji", "urgency", "task", "due_date", "due_hour")}
+        image = generate_ticket(ticket_data, ticket["backend"])
+        if image is None:
+            raise RuntimeError("The ticket could not be rendered")
+        raster = get_raster_cache().get_raster(image)
+
+    job = get_spooler().submit_raster(raster)
+    store.mark_printed(ticket_id)
+    return job
+
+def reprint_ticket(ticket_id):
+    try:
+        job = requeue_ticket(ticket_id)
+    except queue.Full:
+        print_error("The print queue is full. Please wait for the printer and try again.")
+        return None
+    except Exception as e:
+        print_error(f"Error reprinting ticket: {e}")
+        return None
+
+    print_success(f"Ticket ID {ticket_id} queued for reprinting as #{job.id}!")
+    return job
+
+def parse_date_filter(text, end_of_day=False):
+    day = datetime.strptime(text.strip(), "%d/%m/%Y")
+    return day.strftime("%Y-%m-%dT23:59" if end_of_day else "%Y-%m-%dT00:00")
+
+def print_ticket_rows(rows):
+    print(f"    {'ID':>6}  {'Urgency':<10} {'Due':<17} {'Prints':>6}  Task")
+    for row in rows:
+        due = f"{row['due_date']} {row['due_hour']}".strip()
+        task = row["task"] if len(row["task"]) <= 40 else row["task"][:39] + "…"
+        print(f"    {row['id']:>6}  {row['emoji']} {row['urgency']:<8} {due:<17} {row['print_count']:>6}  {task}")
+
+def list_tickets():
+    print("Filter by urgency:")
+    print("""
+    1 - 🚨 - Urgent
+    2 - ⚠️ - High
+    3 - ❗ - Medium
+    4 - 🐢 - Low
+    5 - ✅ - Done
+    Leave blank to show every ticket
+    """)
+    urgency_choice = input("Enter your choice: ").strip()
+    if urgency_choice and urgency_choice not in URGENCY_CHOICES:
+        print_error("Invalid choice. Please try again.")
+        return
+    urgency = URGENCY_CHOICES.get(urgency_choice)
+
+    try:
+        due_from = input("Due from (dd/mm/yyyy, blank for any): ").strip()
+        due_to = input("Due until (dd/mm/yyyy, blank for any): ").strip()
+        due_from = parse_date_filter(due_from) if due_from else None
+        due_to = parse_date_filter(due_to, end_of_day=True) if due_to else None
+    except ValueError:
+        print_error("Invalid date. Use the dd/mm/yyyy format.")
+        return
+
+    store = get_ticket_store()
+    offset = 0
+    while True:
+        rows, total = store.find(urgency, due_from, due_to, limit=TICKET_LIST_PAGE_SIZE, offset=offset)
+        print_dash()
+        if not rows:
+            print("    No tickets found.")
+            return
+
+        print_ticket_rows(rows)
+        print(f"\n    Showing {offset + 1}-{offset + len(rows)} of {total} tickets")
+        has_next = offset + len(rows) < total
+
+        prompt = "Enter a ticket ID to reprint, 'n' for the next page" if has_next else "Enter a ticket ID to reprint"
+        choice = input(f"{prompt} or leave blank to go back: ").strip().lower()
+        if not choice:
+            return
+        if choice == "n" and has_next:
+            offset += TICKET_LIST_PAGE_SIZE
+        elif choice.isdigit():
+            reprint_ticket(int(choice))
+            return
+        else:
+            print_error("Invalid choice. Please try again.")
@@ -0,0 +1,121 @@
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+from utils.settings import TICKET_SIZE
+from utils.visuals import print_error
+
+DUE_LABEL = "Prazo Máximo"
+LINE_HEIGHT = 1.15
+SEPARATOR_HEIGHT = 2
+
+TEXT_FONTS = ["DejaVuSans.ttf", "arial.ttf", "Arial.ttf", "LiberationSans-Regular.ttf", "Helvetica.ttc"]
+BOLD_FONTS = ["DejaVuSans-Bold.ttf", "arialbd.ttf", "Arial Bold.ttf", "LiberationSans-Bold.ttf", "Helvetica.ttc"]
+
+# Color emoji fonts only ship fixed bitmap strikes, so some of them must be loaded at their native size and scaled
+EMOJI_FONTS = [("seguiemj.ttf", None), ("NotoColorEmoji.ttf", 109), ("Apple Color Emoji.ttc", 160)]
+
+# (block, font size, bold, margin top, margin bottom) mirroring the CSS rules of ticket_html.HTML_TEMPLATE
+TICKET_LAYOUT = [
+    ("emoji", 120, False, 0, 5),
+    ("urgency", 50, True, 5, 5),
+    ("separator", None, False, 20, 20),
+    ("task", 36, False, 5, 5),
+    ("separator", None, False, 20, 20),
+    ("due_label", 24, False, 10, 0),
+    ("due_date", 40, True, 3, 0),
+    ("due_hour", 36, True, 3, 0),
+]
+
+@lru_cache(maxsize=None)
+def load_font(size, bold=False):
+    for font_name in BOLD_FONTS if bold else TEXT_FONTS:
+        try:
+            return ImageFont.truetype(font_name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+@lru_cache(maxsize=None)
+def load_emoji_font():
+    for font_name, native_size in EMOJI_FONTS:
+        try:
+            return ImageFont.truetype(font_name, native_size or 120), native_size
+        except OSError:
+            continue
+    # Cached, so this is reported once per process rather than once per ticket
+    print_error("No color emoji font found, tickets are rendered without their emoji")
+    return None, None
+
+@lru_cache(maxsize=64)
+def render_emoji(emoji, size):
+    font, native_size = load_emoji_font()
+    if font is None:
+        # A text font has no emoji glyphs and would print a large empty box instead
+        return None
+
+    left, top, right, bottom = font.getbbox(emoji, mode="RGBA")
+    glyph = Image.new("RGBA", (max(right - left, 1), max(bottom - top, 1)), (255, 255, 255, 0))
+    ImageDraw.Draw(glyph).text((-left, -top), emoji, font=font, fill="black", embedded_color=True)
+
+    if native_size and native_size != size:
+        scale = size / native_size
+        glyph = glyph.resize((max(int(glyph.width * scale), 1), max(int(glyph.height * scale), 1)), Image.LANCZOS)
+    return glyph
+
+def wrap_text(text, font, max_width):
+    lines = []
+    for paragraph in text.splitlines() or [""]:
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if font.getlength(candidate) <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            # Words wider than the ticket are broken by character, like CSS overflow-wrap
+            line = ""
+            for char in word:
+                if font.getlength(line + char) > max_width and line:
+                    lines.append(line)
+                    line = ""
+                line += char
+        lines.append(line)
+    return lines
+
+def render_ticket(ticket_data):
+    width, height = TICKET_SIZE
+    image = Image.new("RGB", TICKET_SIZE, "white")
+    draw = ImageDraw.Draw(image)
+
+    texts = {**{key: str(value) for key, value in ticket_data.items()}, "due_label": DUE_LABEL}
+    y = 0
+    previous_margin = 0
+
+    for block, font_size, bold, margin_top, margin_bottom in TICKET_LAYOUT:
+        # Adjacent vertical margins collapse in the HTML layout, so only the largest one applies
+        y += max(previous_margin, margin_top)
+        previous_margin = margin_bottom
+
+        if block == "separator":
+            draw.rectangle((0, y, width - 1, y + SEPARATOR_HEIGHT - 1), fill="black")
+            y += SEPARATOR_HEIGHT
+            continue
+
+        line_height = round(font_size * LINE_HEIGHT)
+
+        if block == "emoji":
+            glyph = render_emoji(texts.get("emoji", ""), font_size)
+            if glyph is not None:
+                image.paste(glyph, ((width - glyph.width) // 2, y + (line_height - glyph.height) // 2), glyph)
+            y += line_height
+            continue
+
+        font = load_font(font_size, bold)
+        for line in wrap_text(texts.get(block, ""), font, width):
+            draw.text((width // 2, y + line_height // 2), line, font=font, fill="black", anchor="mm")
+            y += line_height
+
+        if y >= height:
+            break
+
+    return image
@@ -0,0 +1,143 @@
+import atexit
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from utils.settings import (
+    GENERATED_DIR,
+    PERSIST_TICKETS,
+    RENDER_CACHE_MAX_BYTES,
+    RENDER_CACHE_MAX_ENTRIES,
+    RENDER_CACHE_MEMORY_ENTRIES,
+    TICKET_SIZE,
+)
+
+def render_key(html_filled, backend):
+    content = f"{backend}|{TICKET_SIZE[0]}x{TICKET_SIZE[1]}|{html_filled}"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+class RenderCache:
+    """Content-addressed ticket images: decoded in memory first, `<render key>.png` files on disk second.
+
+    Both tiers are evicted least recently used first. Writing PNGs is a side effect done by a background
+    writer, so the printer never waits on PNG encoding or disk I/O.
+    """
+
+    def __init__(
+        self,
+        directory=GENERATED_DIR,
+        max_entries=RENDER_CACHE_MAX_ENTRIES,
+        max_bytes=RENDER_CACHE_MAX_BYTES,
+        memory_entries=RENDER_CACHE_MEMORY_ENTRIES,
+        persist=PERSIST_TICKETS,
+    ):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.persist = persist
+        self.images = OrderedDict()
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render-cache-writer")
+
+        os.makedirs(directory, exist_ok=True)
+        # Files left by previous runs (including old uuid-named tickets) count towards the bounds, oldest first
+        existing = [entry for entry in os.scandir(directory) if entry.is_file() and entry.name.endswith(".png")]
+        for entry in sorted(existing, key=lambda entry: entry.stat().st_mtime):
+            self.entries[entry.name] = entry.stat().st_size
+            self.total_bytes += entry.stat().st_size
+        self._evict()
+
+    def get(self, key):
+        file_name = f"{key}.png"
+        with self.lock:
+            if key in self.images:
+                self.images.move_to_end(key)
+                self.hits += 1
+                return self.images[key]
+
+            if file_name in self.entries and os.path.exists(self.path(file_name)):
+                self.entries.move_to_end(file_name)
+                os.utime(self.path(file_name))
+                with Image.open(self.path(file_name)) as image:
+                    image.load()
+                    image = image.convert("RGB")
+                image.info["render_key"] = key
+                self._remember(key, image)
+                self.hits += 1
+                return image
+
+            self.misses += 1
+            return None
+
+    def put(self, key, image):
+        image.info["render_key"] = key
+        with self.lock:
+            self._remember(key, image)
+        if self.persist:
+            self.writer.submit(self._write, key, image)
+        return image
+
+    def path(self, file_name):
+        return os.path.join(self.directory, file_name)
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "memory_entries": len(self.images),
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def flush(self):
+        self.writer.shutdown(wait=True)
+
+    def _write(self, key, image):
+        file_name = f"{key}.png"
+        image.save(self.path(file_name))
+        size = os.path.getsize(self.path(file_name))
+
+        with self.lock:
+            self.total_bytes += size - self.entries.pop(file_name, 0)
+            self.entries[file_name] = size
+            self._evict()
+
+    def _remember(self, key, image):
+        self.images[key] = image
+        self.images.move_to_end(key)
+        while len(self.images) > self.memory_entries:
+            self.images.popitem(last=False)
+
+    def _evict(self):
+        # The most recently used entry is never evicted, so a fresh put is always readable
+        while len(self.entries) > 1 and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            file_name, size = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self.path(file_name))
+            except FileNotFoundError:
+                pass
+
+_render_cache = None
+_render_cache_lock = threading.Lock()
+
+def get_render_cache():
+    global _render_cache
+    with _render_cache_lock:
+        if _render_cache is None:
+            _render_cache = RenderCache()
+            atexit.register(_render_cache.flush)
+        return _render_cache
@@ -0,0 +1,211 @@
+import atexit
+import base64
+import io
+import json
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from html2image.browsers.search_utils import find_chrome
+from PIL import Image
+from websocket import create_connection
+from utils.settings import RENDER_JOB_TIMEOUT, RENDER_POOL_SIZE, TICKET_SIZE
+
+class ChromeSession:
+    """A headless Chrome that stays running and takes screenshots over the DevTools protocol.
+
+    Html2Image starts a new browser for every screenshot; here a ticket costs a page load in a browser that is
+    already up. close() kills the browser, which also makes a screenshot stuck in another thread fail at once.
+    """
+
+    def __init__(self, executable, size=TICKET_SIZE, timeout=RENDER_JOB_TIMEOUT):
+        self.size = size
+        self.timeout = timeout
+        self.profile_dir = tempfile.mkdtemp(prefix="smtt-chrome-")
+        self.connection = None
+        self.last_id = 0
+
+        command = [
+            executable,
+            "--headless=new",
+            "--remote-debugging-port=0",
+            f"--user-data-dir={self.profile_dir}",
+            f"--window-size={size[0]},{size[1]}",
+            "--hide-scrollbars",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--mute-audio",
+        ]
+        if hasattr(os, "geteuid") and os.geteuid() == 0:
+            # Chrome will not start its sandbox as root, which is how it usually runs in containers
+            command.append("--no-sandbox")
+        self.process = subprocess.Popen([*command, "about:blank"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        try:
+            self.connection = create_connection(self.page_url(), timeout=timeout, suppress_origin=True)
+            self.call("Page.enable")
+            self.call("Emulation.setDeviceMetricsOverride", width=size[0], height=size[1], deviceScaleFactor=1, mobile=False)
+        except Exception:
+            self.close()
+            raise
+
+    def page_url(self):
+        # With port 0 Chrome picks a free port and writes it to DevToolsActivePort once it listens
+        port_file = os.path.join(self.profile_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + self.timeout
+        while not os.path.exists(port_file):
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Chrome exited with status {self.process.returncode} before it was ready")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Chrome was not ready within {self.timeout}s")
+            time.sleep(0.05)
+
+        with open(port_file) as f:
+            port = int(f.readline())
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/list", timeout=self.timeout) as response:
+            targets = json.load(response)
+        return next(target["webSocketDebuggerUrl"] for target in targets if target["type"] == "page")
+
+    def send(self, method, **params):
+        self.last_id += 1
+        self.connection.send(json.dumps({"id": self.last_id, "method": method, "params": params}))
+        return self.last_id
+
+    def receive(self, matches):
+        # Events and answers share the socket; whatever is not awaited is dropped
+        while True:
+            message = json.loads(self.connection.recv())
+            if matches(message):
+                return message
+
+    def call(self, method, **params):
+        message_id = self.send(method, **params)
+        message = self.receive(lambda message: message.get("id") == message_id)
+        if "error" in message:
+            raise RuntimeError(f"{method} failed: {message['error'].get('message')}")
+        return message.get("result", {})
+
+    def screenshot(self, html):
+        url = "data:text/html;charset=utf-8;base64," + base64.b64encode(html.encode("utf-8")).decode("ascii")
+        self.send("Page.navigate", url=url)
+        self.receive(lambda message: message.get("method") == "Page.loadEventFired")
+
+        data = self.call("Page.captureScreenshot", format="png")["data"]
+        with Image.open(io.BytesIO(base64.b64decode(data))) as image:
+            return image.convert("RGB")
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def close(self):
+        if self.alive():
+            self.process.kill()
+            self.process.wait()
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+class RenderPool:
+    """Keeps one headless Chrome running per worker thread and feeds them HTML jobs through a queue."""
+
+    def __init__(self, size=RENDER_POOL_SIZE, job_timeout=RENDER_JOB_TIMEOUT):
+        self.size = max(size, 1)
+        self.job_timeout = job_timeout
+        self.jobs = queue.Queue()
+        self.workers = []
+        # Browser of each running job, so render() can kill the one a timed out job is stuck in
+        self.running = {}
+        self.running_lock = threading.Lock()
+        # Browser discovery happens once per pool instead of once per ticket
+        self.executable = find_chrome()
+
+        for index in range(self.size):
+            worker = threading.Thread(target=self._work, name=f"render-worker-{index}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def start_session(self):
+        return ChromeSession(self.executable, TICKET_SIZE, self.job_timeout)
+
+    def _work(self):
+        # Browsers start with the pool so the first ticket does not wait for one; a failure is retried per job
+        try:
+            session = self.start_session()
+        except Exception:
+            session = None
+
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+
+            html, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if session is None or not session.alive():
+                    session = self.start_session()
+                with self.running_lock:
+                    self.running[future] = session
+                future.set_result(session.screenshot(html))
+            except Exception as e:
+                # A browser that failed, hung past its socket timeout or was killed by render() is replaced
+                if session is not None:
+                    session.close()
+                    session = None
+                future.set_exception(e)
+            finally:
+                with self.running_lock:
+                    self.running.pop(future, None)
+
+        if session is not None:
+            session.close()
+
+    def submit(self, html):
+        future = Future()
+        self.jobs.put((html, future))
+        return future
+
+    def render(self, html, timeout=None):
+        future = self.submit(html)
+        try:
+            return future.result(timeout=timeout or self.job_timeout)
+        except FutureTimeoutError:
+            # Not the builtin TimeoutError before Python 3.11
+            if not future.cancel():
+                # Already running: cancel() cannot stop it, killing its browser frees the worker for the next job
+                with self.running_lock:
+                    session = self.running.get(future)
+                if session is not None:
+                    session.close()
+            raise TimeoutError(f"Rendering did not finish within {timeout or self.job_timeout}s")
+
+    def shutdown(self):
+        for _ in self.workers:
+            self.jobs.put(None)
+        for worker in self.workers:
+            worker.join(timeout=self.job_timeout)
+        with self.running_lock:
+            sessions = list(self.running.values())
+        for session in sessions:
+            session.close()
+
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+def get_render_pool():
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = RenderPool()
+            atexit.register(_render_pool.shutdown)
+        return _render_pool
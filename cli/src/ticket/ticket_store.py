@@ -0,0 +1,157 @@
+import atexit
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from utils.settings import GENERATED_DIR, PERSIST_TICKETS, TICKET_LIST_PAGE_SIZE, TICKET_STORE_PATH
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS tickets (
+        id INTEGER PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        emoji TEXT NOT NULL,
+        urgency TEXT NOT NULL,
+        task TEXT NOT NULL,
+        due_date TEXT NOT NULL,
+        due_hour TEXT NOT NULL,
+        due_at TEXT,
+        backend TEXT NOT NULL,
+        render_key TEXT NOT NULL,
+        image_path TEXT,
+        print_count INTEGER NOT NULL DEFAULT 1,
+        last_printed_at TEXT NOT NULL
+    )""",
+    # Listing filters by urgency and due date and sorts on `due_at IS NULL, due_at, id`. The index has to hold that
+    # exact expression to serve the sort; on due_at alone SQLite sorts every page in a temp B-tree. The id tiebreak
+    # comes free, it is the rowid every index entry ends with
+    "DROP INDEX IF EXISTS ix_tickets_urgency_due_at",
+    "DROP INDEX IF EXISTS ix_tickets_due_at",
+    "CREATE INDEX IF NOT EXISTS ix_tickets_urgency_due_order ON tickets (urgency, due_at IS NULL, due_at)",
+    "CREATE INDEX IF NOT EXISTS ix_tickets_due_order ON tickets (due_at IS NULL, due_at)",
+    # One encoded raster per distinct render, kept apart so listing never reads blobs
+    """CREATE TABLE IF NOT EXISTS rasters (
+        render_key TEXT PRIMARY KEY,
+        raster BLOB NOT NULL
+    )""",
+]
+
+LIST_COLUMNS = "id, created_at, emoji, urgency, task, due_date, due_hour, due_at, render_key, image_path, print_count"
+
+def parse_due_at(due_date, due_hour):
+    """Sortable ISO due date for the dd/mm/yyyy and HH:MM the user typed, or None when it is free text."""
+    for text, date_format in ((f"{due_date} {due_hour}".strip(), "%d/%m/%Y %H:%M"), (due_date.strip(), "%d/%m/%Y")):
+        try:
+            return datetime.strptime(text, date_format).isoformat(timespec="minutes")
+        except ValueError:
+            continue
+    return None
+
+def now():
+    return datetime.now().isoformat(timespec="seconds")
+
+class TicketStore:
+    """Printed tickets with their data, render key, PNG location and encoded raster, in a local SQLite file.
+
+    Listing and filtering go through indexes, and reprints send the stored raster without rendering again.
+    One connection is shared behind a lock, so tickets can be recorded and listed from any thread.
+    """
+
+    def __init__(self, path=TICKET_STORE_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            # WAL keeps readers from blocking the writer; NORMAL sync is durable enough for a print log
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+
+    def record(self, ticket_data, backend, render_key, raster):
+        return self.record_many([(ticket_data, backend, render_key, raster)])[0]
+
+    def record_many(self, tickets):
+        """Stores (ticket data, backend, render key, raster) tuples in one transaction and returns their ids."""
+        created_at = now()
+        ids = []
+        with self.lock, self.connection:
+            for ticket_data, backend, render_key, raster in tickets:
+                image_path = os.path.join(GENERATED_DIR, f"{render_key}.png") if PERSIST_TICKETS else None
+                cursor = self.connection.execute(
+                    """INSERT INTO tickets (created_at, emoji, urgency, task, due_date, due_hour, due_at, backend,
+                                            render_key, image_path, last_printed_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (
+                        created_at,
+                        ticket_data["emoji"],
+                        ticket_data["urgency"],
+                        ticket_data["task"],
+                        ticket_data["due_date"],
+                        ticket_data["due_hour"],
+                        parse_due_at(ticket_data["due_date"], ticket_data["due_hour"]),
+                        backend,
+                        render_key,
+                        image_path,
+                        created_at,
+                    ),
+                )
+                ids.append(cursor.lastrowid)
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO rasters (render_key, raster) VALUES (?, ?)", (render_key, raster)
+                )
+        return ids
+
+    def find(self, urgency=None, due_from=None, due_to=None, limit=TICKET_LIST_PAGE_SIZE, offset=0):
+        """Tickets matching the filters, soonest due first (tickets without a parsable due date last)."""
+        conditions, parameters = [], []
+        if urgency:
+            conditions.append("urgency = ?")
+            parameters.append(urgency)
+        if due_from:
+            conditions.append("due_at >= ?")
+            parameters.append(due_from)
+        if due_to:
+            conditions.append("due_at <= ?")
+            parameters.append(due_to)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self.lock:
+            total = self.connection.execute(f"SELECT count(*) FROM tickets {where}", parameters).fetchone()[0]
+            rows = self.connection.execute(
+                f"SELECT {LIST_COLUMNS} FROM tickets {where} ORDER BY due_at IS NULL, due_at, id LIMIT ? OFFSET ?",
+                [*parameters, limit, offset],
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+    def get(self, ticket_id):
+        with self.lock:
+            row = self.connection.execute(f"SELECT {LIST_COLUMNS}, backend FROM tickets WHERE id = ?", (ticket_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def get_raster(self, render_key):
+        with self.lock:
+            row = self.connection.execute("SELECT raster FROM rasters WHERE render_key = ?", (render_key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def mark_printed(self, ticket_id):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE tickets SET print_count = print_count + 1, last_printed_at = ? WHERE id = ?", (now(), ticket_id)
+            )
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+_ticket_store = None
+_ticket_store_lock = threading.Lock()
+
+def get_ticket_store():
+    global _ticket_store
+    with _ticket_store_lock:
+        if _ticket_store is None:
+            _ticket_store = TicketStore()
+            atexit.register(_ticket_store.close)
+        return _ticket_store
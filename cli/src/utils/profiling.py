@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from colorama import init, deinit, Fore, Style
+
+_enabled = False
+_samples = defaultdict(list)
+_lock = threading.Lock()
+
+def enable_profiling():
+    global _enabled
+    _enabled = True
+
+def profiling_enabled():
+    return _enabled
+
+@contextmanager
+def stage(name):
+    """Times the enclosed block under `name` when profiling is on; costs one flag check otherwise."""
+    if not _enabled:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+def record(name, seconds):
+    with _lock:
+        _samples[name].append(seconds)
+
+def take_samples():
+    """Returns and clears the samples of this process, e.g. to send them back from a batch render worker."""
+    global _samples
+    with _lock:
+        samples, _samples = dict(_samples), defaultdict(list)
+    return samples
+
+def merge_samples(samples):
+    with _lock:
+        for name, seconds in samples.items():
+            _samples[name].extend(seconds)
+
+def summarize(seconds):
+    ordered = sorted(seconds)
+
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))] * 1000
+
+    return {
+        "count": len(ordered),
+        "total_ms": sum(ordered) * 1000,
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+def print_profile():
+    with _lock:
+        stages = {name: summarize(seconds) for name, seconds in _samples.items() if seconds}
+
+    init()
+    print(f"{Fore.LIGHTWHITE_EX + Style.BRIGHT}")
+    print("==================================================================")
+    print(f"    {Fore.BLUE}Stage timings{Fore.LIGHTWHITE_EX}")
+    print("==================================================================")
+    if not stages:
+        print("    Nothing was timed.")
+    else:
+        print(f"    {'stage':<18} {'count':>6} {'total ms':>10} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}")
+        for name, stats in sorted(stages.items(), key=lambda item: item[1]["total_ms"], reverse=True):
+            print(
+                f"    {name:<18} {stats['count']:>6} {stats['total_ms']:>10.1f} {stats['mean_ms']:>8.2f} "
+                f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['max_ms']:>8.2f}"
+            )
+    print(f"=================================================================={Style.RESET_ALL}")
+    deinit()
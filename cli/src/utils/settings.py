@@ -0,0 +1,53 @@
+import os
+
+# Resolved from this file so tickets land in cli/src/ticket/generated whatever the working directory is (e.g. the web API)
+GENERATED_DIR = os.getenv("SMTT_GENERATED_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "ticket", "generated"))
+TICKET_SIZE = (384, 750)
+
+# "html" screenshots ticket_html.HTML_TEMPLATE with a headless browser, "native" renders with Pillow; html stays the
+# default until benchmarks/render_diff.py passes against committed reference renders
+RENDER_BACKEND = os.getenv("SMTT_RENDER_BACKEND", "html")
+
+# Headless Chrome processes kept running by the HTML render pool (one per worker) and how long a caller waits for
+# one job; a job that takes longer has its browser killed and replaced
+RENDER_POOL_SIZE = int(os.getenv("SMTT_RENDER_POOL_SIZE", "2"))
+RENDER_JOB_TIMEOUT = float(os.getenv("SMTT_RENDER_JOB_TIMEOUT", "30"))
+
+# Bounds for the content-addressed render cache: decoded images kept in memory and PNGs kept in GENERATED_DIR
+RENDER_CACHE_MEMORY_ENTRIES = int(os.getenv("SMTT_RENDER_CACHE_MEMORY_ENTRIES", "64"))
+RENDER_CACHE_MAX_ENTRIES = int(os.getenv("SMTT_RENDER_CACHE_MAX_ENTRIES", "500"))
+RENDER_CACHE_MAX_BYTES = int(os.getenv("SMTT_RENDER_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+# SQLite file recording every printed ticket for "List all tickets" and reprints, and how many rows a listing page shows
+TICKET_STORE_PATH = os.getenv("SMTT_TICKET_STORE", os.path.join(GENERATED_DIR, "tickets.db"))
+TICKET_LIST_PAGE_SIZE = int(os.getenv("SMTT_TICKET_LIST_PAGE_SIZE", "20"))
+
+# Writing rendered tickets to GENERATED_DIR is an optional side effect done off the print path
+PERSIST_TICKETS = os.getenv("SMTT_PERSIST_TICKETS", "1") == "1"
+
+# USB ids of the POS-58 printer; SMTT_PRINTER_FILE prints to a device/file path instead (e.g. /dev/usb/lp0)
+PRINTER_VENDOR_ID = int(os.getenv("SMTT_PRINTER_VENDOR_ID", "0x0416"), 16)
+PRINTER_PRODUCT_ID = int(os.getenv("SMTT_PRINTER_PRODUCT_ID", "0x5011"), 16)
+PRINTER_FILE = os.getenv("SMTT_PRINTER_FILE")
+
+# Print spooler queue bound and reconnect policy for the persistent printer connection
+PRINT_QUEUE_SIZE = int(os.getenv("SMTT_PRINT_QUEUE_SIZE", "32"))
+PRINT_MAX_ATTEMPTS = int(os.getenv("SMTT_PRINT_MAX_ATTEMPTS", "3"))
+PRINT_BACKOFF_INITIAL = float(os.getenv("SMTT_PRINT_BACKOFF_INITIAL", "0.5"))
+PRINT_BACKOFF_MAX = float(os.getenv("SMTT_PRINT_BACKOFF_MAX", "8"))
+
+# 1-bit conversion used for the pre-encoded ESC/POS raster and its cache size; "floyd" prints exactly what escpos'
+# image() would, "ordered" and "threshold" are faster but change how anti-aliased text and colour emoji look
+RASTER_DITHER = os.getenv("SMTT_RASTER_DITHER", "floyd")
+RASTER_THRESHOLD = int(os.getenv("SMTT_RASTER_THRESHOLD", "128"))
+RASTER_CACHE_ENTRIES = int(os.getenv("SMTT_RASTER_CACHE_ENTRIES", "128"))
+
+# Unix socket the warm daemon listens on for `main.py send`, and how long the daemon waits for a --wait ticket to print
+DAEMON_SOCKET = os.getenv(
+    "SMTT_DAEMON_SOCKET",
+    os.path.join(os.getenv("XDG_RUNTIME_DIR") or "/tmp", f"smtt-{os.getenv('USER', 'daemon')}.sock"),
+)
+DAEMON_TIMEOUT = float(os.getenv("SMTT_DAEMON_TIMEOUT", "30"))
+# A client outwaits the longest the daemon can take to answer (render, then print wait), so it never gives up on a
+# ticket at the moment the daemon reports it printed
+DAEMON_CLIENT_TIMEOUT = DAEMON_TIMEOUT + RENDER_JOB_TIMEOUT + 5
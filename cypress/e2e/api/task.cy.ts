@@ -1,4 +1,4 @@
-import { API_ENDPOINTS } from "@/support/api-config";
+import { API_CONFIG, API_ENDPOINTS } from "@/support/api-config";
 import { newTask, updateTask } from "@/support/data-factory/task";
 
 describe('Task Operations', () => {
@@ -115,6 +115,61 @@ describe('Task Operations', () => {
         });
     });
 
+    it('Should partially update a task by id successfully', () => {
+        if (!access_token) {
+            throw new Error('Access token is not set');
+        }
+        if (!created_task_id) {
+            throw new Error('Created task id is not set');
+        }
+
+        cy.apiPatch(access_token, API_ENDPOINTS.tasks.updateById(created_task_id), { status: 'in_progress' }).then((response) => {
+            expect(response.status).to.eq(200);
+            expect(response.body).to.have.property('id').and.to.be.eq(created_task_id);
+            expect(response.body).to.have.property('status').and.to.be.eq('in_progress');
+        });
+
+        cy.apiPatch(access_token, API_ENDPOINTS.tasks.updateById('0'), { status: 'in_progress' }).then((response) => {
+            expect(response.status).to.eq(404);
+        });
+    });
+
+    it('Should answer conditional requests with ETags', () => {
+        if (!access_token) {
+            throw new Error('Access token is not set');
+        }
+        if (!created_task_id) {
+            throw new Error('Created task id is not set');
+        }
+
+        const url = `${API_CONFIG.baseUrl}${API_ENDPOINTS.tasks.getById(created_task_id)}`;
+
+        cy.apiGet(access_token, API_ENDPOINTS.tasks.getById(created_task_id)).then((response) => {
+            expect(response.status).to.eq(200);
+            const etag = response.headers['etag'];
+            expect(etag).to.be.not.empty;
+
+            cy.request({
+                method: 'GET',
+                url,
+                headers: { ...API_CONFIG.headers(access_token), 'If-None-Match': etag },
+                failOnStatusCode: false
+            }).then((not_modified) => {
+                expect(not_modified.status).to.eq(304);
+            });
+
+            cy.request({
+                method: 'PATCH',
+                url,
+                body: { status: 'pending' },
+                headers: { ...API_CONFIG.headers(access_token), 'If-Match': 'W/"0-0"' },
+                failOnStatusCode: false
+            }).then((stale) => {
+                expect(stale.status).to.eq(412);
+            });
+        });
+    });
+
     it('Should get all tasks successfully', () => {
         if (!access_token) {
             throw new Error('Access token is not set');
@@ -127,6 +182,154 @@ describe('Task Operations', () => {
         });
     });
 
+    it('Should paginate and filter tasks successfully', () => {
+        if (!access_token) {
+            throw new Error('Access token is not set');
+        }
+        if (!create_task_body) {
+            throw new Error('Create task body is not set');
+        }
+
+        cy.apiGet(access_token, `${API_ENDPOINTS.tasks.getAll}?limit=1`).then((response) => {
+            expect(response.status).to.eq(200);
+            expect(response.body).to.be.an('array').and.to.have.length(1);
+        });
+
+        cy.apiGet(access_token, `${API_ENDPOINTS.tasks.getAll}?assigneeId=${current_user_id}`).then((response) => {
+            expect(response.status).to.eq(200);
+            response.body.forEach((task: any) => {
+                expect(task.assigneeId).to.eq(current_user_id);
+            });
+        });
+
+        cy.apiGet(access_token, `${API_ENDPOINTS.tasks.getAll}?cursor=invalid`).then((response) => {
+            expect(response.status).to.eq(400);
+        });
+    });
+
+    it('Should export tasks as NDJSON and CSV successfully', () => {
+        if (!access_token) {
+            throw new Error('Access token is not set');
+        }
+
+        cy.apiGet(access_token, `${API_ENDPOINTS.tasks.export}?assigneeId=${current_user_id}`).then((response) => {
+            expect(response.status).to.eq(200);
+            expect(response.headers['content-type']).to.contain('application/x-ndjson');
+            const lines = response.body.trim().split('\n');
+            expect(lines).to.have.length.greaterThan(0);
+            expect(JSON.parse(lines[0]).assigneeId).to.eq(current_user_id);
+        });
+
+        cy.apiGet(access_token, `${API_ENDPOINTS.tasks.export}?format=csv`).then((response) => {
+            expect(response.status).to.eq(200);
+            expect(response.headers['content-type']).to.contain('text/csv');
+            expect(response.body.split('\n')[0]).to.contain('id,title,description');
+        });
+    });
+
+    it('Should search tasks by title successfully', () => {
+        if (!access_token) {
+            throw new Error('Access token is not set');
+        }
+        if (!created_task_id) {
+            throw new Error('Created task id is not set');
+        }
+
+        cy.apiGet(access_token, API_ENDPOINTS.tasks.getById(created_task_id)).then((task_response) => {
+            cy.apiGet(access_token, API_ENDPOINTS.tasks.search(task_response.body.title)).then((response) => {
+                expect(response.status).to.eq(200);
+                expect(response.body).to.be.an('array');
+                expect(response.body.map((task: any) => task.id)).to.include(created_task_id);
+            });
+        });
+    });
+
+    it('Should get task stats successfully', () => {
+        if (!access_token) {
+            throw new Error('Access token is not set');
+        }
+
+        cy.apiGet(access_token, API_ENDPOINTS.tasks.stats).then((response) => {
+            expect(response.status).to.eq(200);
+            expect(response.body.total).to.be.greaterThan(0);
+            expect(response.body).to.have.property('overdue');
+            expect(response.body.by_status).to.have.all.keys('pending', 'in_progress', 'completed', 'cancelled', 'delayed');
+            expect(response.body.by_priority).to.have.all.keys('low', 'medium', 'high', 'urgent');
+        });
+
+        cy.apiGet(access_token, `${API_ENDPOINTS.tasks.stats}?created_to=2000-01-01T00:00:00Z`).then((response) => {
+            expect(response.status).to.eq(200);
+            expect(response.body.total).to.eq(0);
+        });
+    });
+
+    it('Should enqueue a task print job successfully', () => {
+        if (!access_token) {
+            throw new Error('Access token is not set');
+        }
+        if (!created_task_id) {
+            throw new Error('Created task id is not set');
+        }
+
+        cy.apiPost(access_token, API_ENDPOINTS.tasks.printById(created_task_id), {}).then((response) => {
+            expect(response.status).to.eq(202);
+            expect(response.body).to.have.property('job_id').and.to.be.not.empty;
+            expect(response.body).to.have.property('status');
+            expect(response.body).to.have.property('task_ids').and.to.deep.eq([created_task_id]);
+
+            cy.apiGet(access_token, API_ENDPOINTS.tasks.printJobById(response.body.job_id)).then((job_response) => {
+                expect(job_response.status).to.eq(200);
+                expect(job_response.body).to.have.property('job_id').and.to.be.eq(response.body.job_id);
+            });
+        });
+    });
+
+    it('Should reject printing unknown tasks', () => {
+        if (!access_token) {
+            throw new Error('Access token is not set');
+        }
+
+        cy.apiPost(access_token, API_ENDPOINTS.tasks.printMany, { task_ids: [0] }).then((response) => {
+            expect(response.status).to.eq(404);
+        });
+    });
+
+    it('Should create and update tasks in bulk successfully', () => {
+        if (!access_token) {
+            throw new Error('Access token is not set');
+        }
+        if (!current_user_id) {
+            throw new Error('Current user id is not set');
+        }
+
+        const bodies = [newTask(current_user_id), newTask(current_user_id), { title: 'Invalid task' }];
+
+        cy.apiPost(access_token, API_ENDPOINTS.tasks.bulk, bodies).then((response) => {
+            expect(response.status).to.eq(201);
+            expect(response.body.tasks).to.have.length(2);
+            expect(response.body.errors).to.have.length(1);
+            expect(response.body.errors[0].index).to.eq(2);
+
+            const ids = response.body.tasks.map((task: any) => task.id);
+            const updates = [...ids.map((id: number) => ({ id, status: 'completed' })), { id: 0, status: 'completed' }, 'Not a task'];
+
+            cy.apiPatch(access_token, API_ENDPOINTS.tasks.bulk, updates).then((patch_response) => {
+                expect(patch_response.status).to.eq(200);
+                expect(patch_response.body.tasks).to.have.length(2);
+                patch_response.body.tasks.forEach((task: any) => {
+                    expect(task.status).to.eq('completed');
+                });
+                expect(patch_response.body.errors).to.have.length(2);
+                expect(patch_response.body.errors[0].id).to.eq(0);
+                expect(patch_response.body.errors[1].index).to.eq(3);
+            }).then(() => {
+                ids.forEach((id: string) => {
+                    cy.apiDelete(access_token, API_ENDPOINTS.tasks.deleteById(id));
+                });
+            });
+        });
+    });
+
     after(() => {
         cy.log('Cleanup: deleting created task');
         if (created_task_id) {
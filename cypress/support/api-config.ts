@@ -19,5 +19,12 @@ export const API_CONFIG = {
       getById: (id: string) => `/tasks/${id}`,
       updateById: (id: string) => `/tasks/${id}`,
       deleteById: (id: string) => `/tasks/${id}`,
+      printById: (id: string) => `/tasks/${id}/print`,
+      printMany: '/tasks/print',
+      printJobById: (id: string) => `/tasks/print-jobs/${id}`,
+      bulk: '/tasks/bulk',
+      export: '/tasks/export',
+      stats: '/tasks/stats',
+      search: (q: string) => `/tasks/search?q=${encodeURIComponent(q)}`,
     },
   };
\ No newline at end of file
@@ -8,6 +8,7 @@ declare global {
             apiGet(token: string, endpoint: string): Chainable<any>;
             apiPost(token: string, endpoint: string, body: any): Chainable<any>;
             apiPut(token: string, endpoint: string, body: any): Chainable<any>;
+            apiPatch(token: string, endpoint: string, body: any): Chainable<any>;
             apiDelete(token: string, endpoint: string): Chainable<any>;
             compareDatesWithTolerance(date1: string, date2: string): Chainable<boolean>;
         }
@@ -64,6 +65,16 @@ Cypress.Commands.add('apiPut', (token, endpoint, body) => {
     });
 });
 
+Cypress.Commands.add('apiPatch', (token, endpoint, body) => {
+    return cy.request({
+        method: 'PATCH',
+        url: `${API_CONFIG.baseUrl}${endpoint}`,
+        body: body,
+        headers: API_CONFIG.headers(token),
+        failOnStatusCode: false
+    });
+});
+
 Cypress.Commands.add('apiDelete', (token, endpoint) => {
     return cy.request({
         method: 'DELETE',
@@ -14,12 +14,14 @@ interface KanbanColumnConfig {
 
 interface KanbanBoardProps {
   tasks: Task[];
+  // Totais por status vindos do servidor; sem eles a coluna conta só os cartões carregados
+  counts?: Record<TaskStatus, number>;
   columns: KanbanColumnConfig[];
   onTaskUpdate?: (task: Task) => void;
   onTaskClick?: (task: Task) => void;
 }
 
-const KanbanBoard: React.FC<KanbanBoardProps> = ({ tasks, columns, onTaskUpdate, onTaskClick }) => {
+const KanbanBoard: React.FC<KanbanBoardProps> = ({ tasks, counts, columns, onTaskUpdate, onTaskClick }) => {
   const [activeTask, setActiveTask] = useState<Task | null>(null);
   const [isUpdating, setIsUpdating] = useState(false);
 
@@ -101,6 +103,7 @@ const KanbanBoard: React.FC<KanbanBoardProps> = ({ tasks, columns, onTaskUpdate,
               key={column.id}
               title={column.title}
               tasks={tasksByStatus[column.id] || []}
+              count={counts?.[column.id]}
               status={column.id}
               color={column.color}
               textColor={column.textColor}
@@ -6,6 +6,7 @@ import KanbanCard from './KanbanCard';
 interface KanbanColumnProps {
   title: string;
   tasks: Task[];
+  count?: number;
   status: TaskStatus;
   color: string;
   textColor: string;
@@ -15,6 +16,7 @@ interface KanbanColumnProps {
 const KanbanColumn: React.FC<KanbanColumnProps> = ({
   title,
   tasks,
+  count,
   status,
   color,
   textColor,
@@ -34,7 +36,7 @@ const KanbanColumn: React.FC<KanbanColumnProps> = ({
             {title}
           </h3>
           <span className={`px-3 py-1 rounded-full text-sm font-bold ${textColor} bg-white/80 shadow-sm`}>
-            {tasks.length}
+            {count ?? tasks.length}
           </span>
         </div>
 
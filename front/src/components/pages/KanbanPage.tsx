@@ -1,7 +1,8 @@
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useEffect } from 'react';
 import { useTasksContext } from '../../contexts/TasksContext';
 import { TaskStatus, TaskStatusLabels, Task } from '../../types/task';
 import KanbanBoard from '../kanban/KanbanBoard';
+import Button from '../ui/Button';
 import Loading from '../ui/Loading';
 import TicketViewModal from '../ticket/TicketViewModal';
 
@@ -11,7 +12,7 @@ interface KanbanPageProps {
 }
 
 const KanbanPage: React.FC<KanbanPageProps> = ({ onEditTask, onCreateNew }) => {
-  const { tasks, isLoading, error, refetch } = useTasksContext();
+  const { tasks, stats, isLoading, error, refetch, hasMore, isLoadingMore, loadMore, setQuery } = useTasksContext();
   const [selectedMonth, setSelectedMonth] = useState<string>('');
   const [selectedTask, setSelectedTask] = useState<Task | null>(null);
   const [isModalOpen, setIsModalOpen] = useState(false);
@@ -37,29 +38,36 @@ const KanbanPage: React.FC<KanbanPageProps> = ({ onEditTask, onCreateNew }) => {
     }
   };
 
-  // Filtrar tarefas por mês
-  const filteredTasks = useMemo(() => {
-    if (!selectedMonth) return tasks;
-    
-    return tasks.filter(task => {
-      const taskDate = new Date(task.created_at);
-      const taskMonth = `${taskDate.getFullYear()}-${String(taskDate.getMonth() + 1).padStart(2, '0')}`;
-      return taskMonth === selectedMonth;
+  // O mês vira um intervalo de criação filtrado pela API, senão só as páginas já carregadas seriam filtradas
+  useEffect(() => {
+    if (!selectedMonth) {
+      setQuery({});
+      return;
+    }
+    const [year, month] = selectedMonth.split('-').map(Number);
+    setQuery({
+      createdFrom: new Date(year, month - 1, 1).toISOString(),
+      createdTo: new Date(year, month, 1).toISOString(),
     });
-  }, [tasks, selectedMonth]);
+  }, [selectedMonth, setQuery]);
 
-  // Gerar opções de meses baseadas nas tarefas
+  // Opções de meses: os últimos 12 e os das tarefas carregadas, que podem ser mais antigos
   const monthOptions = useMemo(() => {
     const months = new Set<string>();
-    tasks.forEach(task => {
-      const taskDate = new Date(task.created_at);
-      const monthKey = `${taskDate.getFullYear()}-${String(taskDate.getMonth() + 1).padStart(2, '0')}`;
-      const monthLabel = taskDate.toLocaleDateString('pt-BR', { 
+    const addMonth = (date: Date) => {
+      const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
+      const monthLabel = date.toLocaleDateString('pt-BR', { 
         year: 'numeric', 
         month: 'long' 
       });
       months.add(`${monthKey}|${monthLabel}`);
-    });
+    };
+
+    const today = new Date();
+    for (let offset = 0; offset < 12; offset++) {
+      addMonth(new Date(today.getFullYear(), today.getMonth() - offset, 1));
+    }
+    tasks.forEach(task => addMonth(new Date(task.created_at)));
     
     return Array.from(months).sort().reverse(); // Mais recentes primeiro
   }, [tasks]);
@@ -130,7 +138,7 @@ const KanbanPage: React.FC<KanbanPageProps> = ({ onEditTask, onCreateNew }) => {
             </div>
             <div className="flex items-center space-x-4">
               <div className="text-right">
-                <div className="text-2xl font-bold text-white">{filteredTasks.length}</div>
+                <div className="text-2xl font-bold text-white">{stats ? stats.total : tasks.length}</div>
                 <div className="text-sm text-white/70">Tarefas</div>
               </div>
               <div className="w-px h-12 bg-white/20"></div>
@@ -173,7 +181,13 @@ const KanbanPage: React.FC<KanbanPageProps> = ({ onEditTask, onCreateNew }) => {
         </div>
         
         <div className="p-8">
-          {filteredTasks.length === 0 ? (
+          {hasMore && stats && (
+            <p className="mb-6 text-sm text-gray-500">
+              {`Exibindo ${tasks.length} de ${stats.total} tarefas; os totais das colunas contam todas`}
+            </p>
+          )}
+
+          {tasks.length === 0 ? (
             <div className="text-center py-16 bg-gray-50 rounded-2xl">
               <div className="w-20 h-20 bg-gray-200 rounded-full flex items-center justify-center mx-auto mb-6">
                 <svg className="w-10 h-10 text-gray-400" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -189,12 +203,22 @@ const KanbanPage: React.FC<KanbanPageProps> = ({ onEditTask, onCreateNew }) => {
             </div>
           ) : (
             <KanbanBoard 
-              tasks={filteredTasks} 
+              tasks={tasks} 
+              counts={stats?.by_status}
               columns={columns} 
               onTaskUpdate={handleTaskUpdate}
               onTaskClick={handleViewTask}
             />
           )}
+
+          {/* Próxima página da API, buscada só quando pedida */}
+          {hasMore && (
+            <div className="mt-6 flex justify-center">
+              <Button onClick={loadMore} disabled={isLoadingMore} variant="outline" size="md">
+                {isLoadingMore ? 'Carregando...' : 'Carregar mais tarefas'}
+              </Button>
+            </div>
+          )}
         </div>
       </div>
 
@@ -1,4 +1,4 @@
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useEffect } from 'react';
 import { useTasksContext } from '../../contexts/TasksContext';
 import { TaskStatus, TaskPriority, TaskStatusLabels, TaskPriorityLabels, TaskCategoryLabels, Task } from '../../types/task';
 import Button from '../ui/Button';
@@ -12,7 +12,7 @@ interface ListTicketsPageProps {
 }
 
 const ListTicketsPage: React.FC<ListTicketsPageProps> = ({ onEditTask, onCreateNew }) => {
-  const { tasks, isLoading, error, refetch } = useTasksContext();
+  const { tasks, stats, isLoading, error, refetch, hasMore, isLoadingMore, loadMore, setQuery } = useTasksContext();
   const [filters, setFilters] = useState({
     priority: '',
     status: '',
@@ -23,24 +23,31 @@ const ListTicketsPage: React.FC<ListTicketsPageProps> = ({ onEditTask, onCreateN
   const [currentPage, setCurrentPage] = useState(1);
   const itemsPerPage = 5;
 
-  const filteredTasks = useMemo(() => {
-    return tasks.filter(task => {
-      const matchesPriority = !filters.priority || task.priority === filters.priority;
-      const matchesStatus = !filters.status || task.status === filters.status;
-      const matchesSearch = !filters.search || 
-        task.title.toLowerCase().includes(filters.search.toLowerCase()) ||
-        task.description.toLowerCase().includes(filters.search.toLowerCase());
-      
-      return matchesPriority && matchesStatus && matchesSearch;
+  const [search, setSearch] = useState('');
+
+  // A busca só vai ao servidor quando a digitação para por um instante
+  useEffect(() => {
+    const timeout = setTimeout(() => setSearch(filters.search.trim().slice(0, 200)), 300);
+    return () => clearTimeout(timeout);
+  }, [filters.search]);
+
+  // Os filtros são aplicados pela API, senão cobririam apenas as páginas já carregadas
+  useEffect(() => {
+    setQuery({
+      ...(filters.priority && { priority: filters.priority as TaskPriority }),
+      ...(filters.status && { status: filters.status as TaskStatus }),
+      ...(search && { search }),
     });
-  }, [tasks, filters]);
+  }, [filters.priority, filters.status, search, setQuery]);
+
+  const hasFilters = Boolean(filters.priority || filters.status || search);
 
   const paginatedTasks = useMemo(() => {
     const startIndex = (currentPage - 1) * itemsPerPage;
-    return filteredTasks.slice(startIndex, startIndex + itemsPerPage);
-  }, [filteredTasks, currentPage, itemsPerPage]);
+    return tasks.slice(startIndex, startIndex + itemsPerPage);
+  }, [tasks, currentPage, itemsPerPage]);
 
-  const totalPages = Math.ceil(filteredTasks.length / itemsPerPage);
+  const totalPages = Math.ceil(tasks.length / itemsPerPage);
 
   const getPriorityColor = (priority: TaskPriority) => {
     switch (priority) {
@@ -128,7 +135,11 @@ const ListTicketsPage: React.FC<ListTicketsPageProps> = ({ onEditTask, onCreateN
               <div>
                 <h3 className="text-lg font-semibold text-gray-800">Filtros</h3>
                 <p className="text-sm text-gray-500 mt-1">
-                  {tasks.length > 0 ? `${tasks.length} tarefa(s) carregada(s)` : 'Nenhuma tarefa encontrada'}
+                  {tasks.length === 0
+                    ? 'Nenhuma tarefa encontrada'
+                    : stats
+                      ? `${tasks.length} de ${stats.total} tarefa(s) carregada(s)`
+                      : `${tasks.length} tarefa(s) carregada(s)${hasMore ? ', há mais resultados' : ''}`}
                 </p>
               </div>
               <div className="flex items-center space-x-3">
@@ -278,7 +289,7 @@ const ListTicketsPage: React.FC<ListTicketsPageProps> = ({ onEditTask, onCreateN
           </div>
           )}
 
-          {!isLoading && filteredTasks.length === 0 && (
+          {!isLoading && tasks.length === 0 && (
             <div className="text-center py-16 bg-gray-50 rounded-2xl">
               <div className="w-20 h-20 bg-gray-200 rounded-full flex items-center justify-center mx-auto mb-6">
                 <svg className="w-10 h-10 text-gray-400" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -286,24 +297,33 @@ const ListTicketsPage: React.FC<ListTicketsPageProps> = ({ onEditTask, onCreateN
                 </svg>
               </div>
               <h3 className="text-xl font-semibold text-gray-800 mb-2">
-                {tasks.length === 0 ? 'Nenhuma tarefa encontrada' : 'Nenhuma tarefa corresponde aos filtros'}
+                {hasFilters ? 'Nenhuma tarefa corresponde aos filtros' : 'Nenhuma tarefa encontrada'}
               </h3>
               <p className="text-gray-600 text-lg">
-                {tasks.length === 0 ? 'Crie sua primeira tarefa para começar!' : 'Tente ajustar os filtros de busca'}
+                {hasFilters ? 'Tente ajustar os filtros de busca' : 'Crie sua primeira tarefa para começar!'}
               </p>
             </div>
           )}
 
           {/* Paginação */}
-          {!isLoading && filteredTasks.length > itemsPerPage && (
+          {!isLoading && tasks.length > itemsPerPage && (
             <Pagination
               currentPage={currentPage}
               totalPages={totalPages}
               onPageChange={handlePageChange}
-              totalItems={filteredTasks.length}
+              totalItems={tasks.length}
               itemsPerPage={itemsPerPage}
             />
           )}
+
+          {/* Próxima página da API, buscada só quando pedida */}
+          {!isLoading && hasMore && (
+            <div className="mt-6 flex justify-center">
+              <Button onClick={loadMore} disabled={isLoadingMore} variant="outline" size="md">
+                {isLoadingMore ? 'Carregando...' : 'Carregar mais tarefas'}
+              </Button>
+            </div>
+          )}
         </div>
       </div>
 
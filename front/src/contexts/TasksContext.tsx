@@ -1,11 +1,17 @@
 import React, { createContext, useContext, ReactNode } from 'react';
 import { useTasks } from '../hooks/useTasks';
-import { Task } from '../types/task';
+import { TaskQuery } from '../services/task';
+import { Task, TaskStats } from '../types/task';
 
 interface TasksContextType {
   tasks: Task[];
+  stats: TaskStats | null;
   isLoading: boolean;
   error: string | null;
+  hasMore: boolean;
+  isLoadingMore: boolean;
+  loadMore: () => Promise<void>;
+  setQuery: (query: TaskQuery) => void;
   refetch: () => Promise<void>;
   invalidateCache: () => void;
 }
@@ -1,13 +1,20 @@
 import { useState, useEffect, useCallback } from 'react';
-import { TaskService } from '../services/task';
-import { Task } from '../types/task';
+import { TaskQuery, TaskService } from '../services/task';
+import { Task, TaskStats } from '../types/task';
 
 // Cache global persistente
 class TasksCache {
   private static instance: TasksCache;
   private tasks: Task[] = [];
   private lastFetch: number = 0;
+  private nextCursor: string | null = null;
+  private stats: TaskStats | null = null;
+  private query: TaskQuery = {};
+  private queryKey: string = '{}';
+  // Cada troca de filtros invalida as respostas ainda pendentes da consulta anterior
+  private requestId: number = 0;
   private isLoading: boolean = false;
+  private isLoadingMore: boolean = false;
   private error: string | null = null;
   private listeners: Set<() => void> = new Set();
   private readonly CACHE_DURATION = 5 * 60 * 1000; // 5 minutos
@@ -28,6 +35,22 @@ class TasksCache {
     this.listeners.forEach(listener => listener());
   }
 
+  // Troca os filtros enviados à API e recarrega a primeira página com eles
+  setQuery(query: TaskQuery): void {
+    const queryKey = JSON.stringify(query);
+    if (queryKey === this.queryKey) return;
+
+    this.query = query;
+    this.queryKey = queryKey;
+    this.tasks = [];
+    this.nextCursor = null;
+    this.stats = null;
+    this.lastFetch = 0;
+    // A carga da consulta anterior ainda pode estar em andamento; sua resposta será descartada
+    this.isLoading = false;
+    this.fetchTasks(true);
+  }
+
   async fetchTasks(forceRefresh = false): Promise<void> {
     const now = Date.now();
     const isCacheValid = now - this.lastFetch < this.CACHE_DURATION;
@@ -42,19 +65,63 @@ class TasksCache {
 
     if (this.isLoading) return; // Evita múltiplas requisições simultâneas
 
+    const requestId = ++this.requestId;
+    const query = this.query;
+
     try {
       this.isLoading = true;
+      this.isLoadingMore = false;
       this.error = null;
       this.notify();
 
-      const data = await TaskService.getTasks();
-      this.tasks = data;
+      // Só a primeira página; as demais vêm de loadMore, então o custo não cresce com a tabela.
+      // As contagens vêm do servidor para cobrir todas as tarefas que atendem aos filtros
+      const [page, stats] = await Promise.all([
+        TaskService.getTasks(query),
+        query.search ? Promise.resolve(null) : TaskService.getTaskStats(query),
+      ]);
+      if (requestId !== this.requestId) return;
+
+      this.tasks = page.tasks;
+      this.nextCursor = page.nextCursor;
+      this.stats = stats;
       this.lastFetch = now;
     } catch (err) {
+      if (requestId !== this.requestId) return;
       this.error = err instanceof Error ? err.message : 'Erro ao carregar tarefas';
     } finally {
-      this.isLoading = false;
+      if (requestId === this.requestId) {
+        this.isLoading = false;
+        this.notify();
+      }
+    }
+  }
+
+  async loadMore(): Promise<void> {
+    if (!this.nextCursor || this.isLoading || this.isLoadingMore) return;
+
+    const requestId = this.requestId;
+
+    try {
+      this.isLoadingMore = true;
+      this.error = null;
       this.notify();
+
+      const page = await TaskService.getTasks(this.query, this.nextCursor);
+      if (requestId !== this.requestId) return;
+
+      // Tarefas criadas localmente já estão no topo da lista e podem reaparecer nas páginas seguintes
+      const loadedIds = new Set(this.tasks.map(task => task.id));
+      this.tasks = [...this.tasks, ...page.tasks.filter(task => !loadedIds.has(task.id))];
+      this.nextCursor = page.nextCursor;
+    } catch (err) {
+      if (requestId !== this.requestId) return;
+      this.error = err instanceof Error ? err.message : 'Erro ao carregar mais tarefas';
+    } finally {
+      if (requestId === this.requestId) {
+        this.isLoadingMore = false;
+        this.notify();
+      }
     }
   }
 
@@ -62,6 +129,18 @@ class TasksCache {
     return this.tasks;
   }
 
+  getStats(): TaskStats | null {
+    return this.stats;
+  }
+
+  getHasMore(): boolean {
+    return this.nextCursor !== null;
+  }
+
+  getIsLoadingMore(): boolean {
+    return this.isLoadingMore;
+  }
+
   getIsLoading(): boolean {
     return this.isLoading;
   }
@@ -94,8 +173,13 @@ class TasksCache {
 
 interface UseTasksReturn {
   tasks: Task[];
+  stats: TaskStats | null;
   isLoading: boolean;
   error: string | null;
+  hasMore: boolean;
+  isLoadingMore: boolean;
+  loadMore: () => Promise<void>;
+  setQuery: (query: TaskQuery) => void;
   refetch: () => Promise<void>;
   invalidateCache: () => void;
 }
@@ -118,14 +202,27 @@ export const useTasks = (): UseTasksReturn => {
     return cache.fetchTasks(true);
   }, [cache]);
 
+  const loadMore = useCallback(() => {
+    return cache.loadMore();
+  }, [cache]);
+
+  const setQuery = useCallback((query: TaskQuery) => {
+    cache.setQuery(query);
+  }, [cache]);
+
   const invalidateCache = useCallback(() => {
     cache.invalidateCache();
   }, [cache]);
 
   return {
     tasks: cache.getTasks(),
+    stats: cache.getStats(),
     isLoading: cache.getIsLoading(),
     error: cache.getError(),
+    hasMore: cache.getHasMore(),
+    isLoadingMore: cache.getIsLoadingMore(),
+    loadMore,
+    setQuery,
     refetch,
     invalidateCache,
   };
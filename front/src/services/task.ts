@@ -1,7 +1,21 @@
 import { API_CONFIG, getApiUrl } from '../config/api';
-import { Task, TaskCreateRequest, TaskUpdateRequest } from '../types/task';
+import { Task, TaskCreateRequest, TaskPriority, TaskStats, TaskStatus, TaskUpdateRequest } from '../types/task';
 import { authService } from './auth';
 
+export interface TaskPage {
+  tasks: Task[];
+  nextCursor: string | null;
+}
+
+// Filtros aplicados pela API, para que listas e contagens cubram todas as tarefas e não só as páginas carregadas
+export interface TaskQuery {
+  status?: TaskStatus;
+  priority?: TaskPriority;
+  search?: string;
+  createdFrom?: string;
+  createdTo?: string;
+}
+
 export class TaskService {
   private static baseUrl = getApiUrl(API_CONFIG.ENDPOINTS.TASKS);
 
@@ -13,8 +27,25 @@ export class TaskService {
     };
   }
 
-  static async getTasks(): Promise<Task[]> {
-    const response = await fetch(this.baseUrl, {
+  private static getFilterParams(query: TaskQuery): URLSearchParams {
+    const params = new URLSearchParams();
+    if (query.status) params.set('status', query.status);
+    if (query.priority) params.set('priority', query.priority);
+    if (query.createdFrom) params.set('created_from', query.createdFrom);
+    if (query.createdTo) params.set('created_to', query.createdTo);
+    return params;
+  }
+
+  // Busca uma única página; o cabeçalho X-Next-Cursor indica a próxima, que só é pedida sob demanda
+  static async getTasks(query: TaskQuery = {}, cursor: string | null = null): Promise<TaskPage> {
+    const params = this.getFilterParams(query);
+    if (query.search) params.set('q', query.search);
+    if (cursor) params.set('cursor', cursor);
+
+    // Com texto a busca vai para /search, que ordena por relevância e aceita os mesmos filtros
+    const path = query.search ? `${this.baseUrl}/search` : this.baseUrl;
+    const queryString = params.toString();
+    const response = await fetch(queryString ? `${path}?${queryString}` : path, {
       method: 'GET',
       headers: this.getAuthHeaders(),
     });
@@ -23,6 +54,25 @@ export class TaskService {
       throw new Error(`Erro ao buscar tarefas: ${response.statusText}`);
     }
 
+    return {
+      tasks: await response.json(),
+      nextCursor: response.headers.get('X-Next-Cursor'),
+    };
+  }
+
+  // Contagens calculadas no servidor com os mesmos filtros da lista; a busca por texto não é suportada aqui
+  static async getTaskStats(query: TaskQuery = {}): Promise<TaskStats> {
+    const queryString = this.getFilterParams(query).toString();
+    const url = queryString ? `${this.baseUrl}/stats?${queryString}` : `${this.baseUrl}/stats`;
+    const response = await fetch(url, {
+      method: 'GET',
+      headers: this.getAuthHeaders(),
+    });
+
+    if (!response.ok) {
+      throw new Error(`Erro ao buscar estatísticas: ${response.statusText}`);
+    }
+
     return response.json();
   }
 
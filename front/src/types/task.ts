@@ -56,6 +56,14 @@ export interface TaskUpdateRequest {
   assigneeId: number;
 }
 
+export interface TaskStats {
+  total: number;
+  overdue: number;
+  by_status: Record<TaskStatus, number>;
+  by_priority: Record<TaskPriority, number>;
+  by_category: Record<TaskCategory, number>;
+}
+
 // Mapeamentos para exibição em português
 export const TaskStatusLabels: Record<TaskStatus, string> = {
   [TaskStatus.PENDING]: "Pendente",
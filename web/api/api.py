@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 
-from web.api.v1.endpoints import auth, task
-from web.core.deps import get_current_user
+from web.api.v1.endpoints import admin, auth, task
+from web.core.deps import get_current_admin_user, get_current_user
 
 api_router = APIRouter()
 
@@ -11,5 +11,6 @@ async def health():
 
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(task.router, prefix="/tasks", tags=["tasks"], dependencies=[Depends(get_current_user)])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"], dependencies=[Depends(get_current_admin_user)])
 
 
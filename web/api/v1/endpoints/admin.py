@@ -0,0 +1,19 @@
+from fastapi import APIRouter, status
+
+from web.core.cache import task_stats_cache, user_cache
+from web.core.database import pool_stats
+from web.core.events import task_broadcaster
+from web.core.security import bcrypt_metrics
+from web.schemas.admin_schema import AdminStatsSchema
+
+router = APIRouter()
+
+@router.get("/stats", response_model=AdminStatsSchema, status_code=status.HTTP_200_OK)
+async def get_stats_endpoint():
+    return {
+        "db_pool": pool_stats(),
+        "user_cache": user_cache.stats(),
+        "task_stats_cache": task_stats_cache.stats(),
+        "bcrypt": bcrypt_metrics.stats(),
+        "task_stream": task_broadcaster.stats(),
+    }
@@ -1,28 +1,177 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from typing import Any, List, Literal, Optional
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from web.core.config import settings
-from web.schemas.task_schema import TaskCreateSchema, TaskUpdateSchema, TaskResponseSchema
+from web.core.etag import collection_etag, etag_matches, task_etag, task_versions
+from web.core.events import format_sse, task_broadcaster, task_events
+from web.core.export import EXPORT_MEDIA_TYPES, csv_chunks, ndjson_chunks
+from web.core.pagination import decode_cursor, decode_offset_cursor
+from web.schemas.task_schema import (
+    TaskBulkResponseSchema,
+    TaskCreateSchema,
+    TaskFilterSchema,
+    TaskListAdapter,
+    TaskPatchSchema,
+    TaskResponseSchema,
+    TaskStatsSchema,
+    TaskUpdateSchema,
+)
+from web.schemas.print_job_schema import PrintJobResponseSchema, PrintTasksSchema
 from web.core.deps import get_session
+from web.core.print_jobs import print_queue
 from sqlalchemy.ext.asyncio import AsyncSession
-from web.repositories.task_repository import create_task, delete_task, get_task_by_id, get_tasks, update_task
+from web.repositories.task_repository import (
+    create_task,
+    create_tasks_bulk,
+    delete_task,
+    get_task_by_id,
+    get_task_stats,
+    get_task_version,
+    get_tasks,
+    get_tasks_versions,
+    get_tasks_by_ids,
+    patch_task,
+    search_tasks,
+    stream_tasks,
+    update_task,
+    update_tasks_bulk,
+)
 
 router = APIRouter()
 
+# Clients must revalidate every time, but an unchanged resource then costs a 304 instead of a full body
+CACHE_CONTROL = "private, no-cache"
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
 @router.get("/", response_model=List[TaskResponseSchema], status_code=status.HTTP_200_OK)
-async def get_tasks_endpoint(db: AsyncSession = Depends(get_session)):
+async def get_tasks_endpoint(
+    filters: TaskFilterSchema = Depends(),
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.TASKS_PAGE_SIZE, ge=1, le=settings.TASKS_PAGE_MAX),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_session),
+):
+        if cursor:
+            try:
+                decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
         try:
-            result = await get_tasks(db)
-            return result
+            if if_none_match:
+                # Only ids and versions of the page are read to answer an unchanged poll
+                versions, next_cursor = await get_tasks_versions(db, filters, cursor, limit)
+                etag = collection_etag(versions, next_cursor)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+            rows, next_cursor = await get_tasks(db, filters, cursor, limit)
+            # Returning bytes skips FastAPI's per-item response_model validation and jsonable_encoder pass
+            body = TaskListAdapter.dump_json(TaskListAdapter.validate_python(rows))
+            response = Response(content=body, media_type="application/json")
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+            set_etag(response, collection_etag(((row["id"], row["updated_at"]) for row in rows), next_cursor))
+            return response
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error getting tasks: {e}")
 
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_tasks_endpoint(
+    filters: TaskFilterSchema = Depends(),
+    format: Literal["ndjson", "csv"] = "ndjson",
+):
+    batches = stream_tasks(filters, settings.TASKS_EXPORT_BATCH)
+    chunks = csv_chunks(batches) if format == "csv" else ndjson_chunks(batches)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'},
+    )
+
+@router.get("/search", response_model=List[TaskResponseSchema], status_code=status.HTTP_200_OK)
+async def search_tasks_endpoint(
+    q: str = Query(..., min_length=1, max_length=200),
+    filters: TaskFilterSchema = Depends(),
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.TASKS_PAGE_SIZE, ge=1, le=settings.TASKS_PAGE_MAX),
+    db: AsyncSession = Depends(get_session),
+):
+    try:
+        offset = decode_offset_cursor(cursor) if cursor else 0
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        rows, next_cursor = await search_tasks(q, db, filters, offset, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching tasks: {e}")
+    response = Response(content=TaskListAdapter.dump_json(TaskListAdapter.validate_python(rows)), media_type="application/json")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+@router.get("/stats", response_model=TaskStatsSchema, status_code=status.HTTP_200_OK)
+async def get_task_stats_endpoint(filters: TaskFilterSchema = Depends(), db: AsyncSession = Depends(get_session)):
+    try:
+        return await get_task_stats(db, filters)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting task stats: {e}")
+
+@router.get("/stream", status_code=status.HTTP_200_OK)
+async def stream_tasks_endpoint(request: Request, db: AsyncSession = Depends(get_session)):
+    # The request session only served authentication; closing it keeps a pooled connection from
+    # being held for as long as the stream stays open
+    await db.close()
+    await task_events.start()
+
+    async def events():
+        async with task_broadcaster.subscribe() as subscription:
+            yield format_sse(None, "connected")
+            while not subscription.dropped and not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), settings.TASK_STREAM_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield format_sse(None, "keepalive")
+                    continue
+                yield format_sse(event)
+            if subscription.dropped:
+                # Events were lost for this client, it has to refetch the list before streaming again
+                yield "event: dropped\ndata: {}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.get("/{task_id}", response_model=TaskResponseSchema, status_code=status.HTTP_200_OK)
-async def get_task_by_id_endpoint(task_id: int, db: AsyncSession = Depends(get_session)):
+async def get_task_by_id_endpoint(
+    task_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_session),
+):
     try:
+        if if_none_match:
+            updated_at = await get_task_version(task_id, db)
+            if updated_at is not None and etag_matches(if_none_match, task_etag(task_id, updated_at)):
+                return not_modified(task_etag(task_id, updated_at))
+
         result = await get_task_by_id(task_id, db)
-        return result
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Error getting task with id {task_id}: {e}")
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Task with id {task_id} not found")
+    set_etag(response, task_etag(result.id, result.updated_at))
+    return result
 
 @router.post("/", response_model=TaskResponseSchema, status_code=status.HTTP_201_CREATED)
 async def create_task_endpoint(new_task: TaskCreateSchema, db: AsyncSession = Depends(get_session)):
@@ -32,17 +181,100 @@ async def create_task_endpoint(new_task: TaskCreateSchema, db: AsyncSession = De
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error creating task: {e}")
 
+def check_bulk_size(items: List[Any]):
+    if not items:
+        raise HTTPException(status_code=400, detail="No tasks given")
+    if len(items) > settings.TASKS_BULK_MAX:
+        raise HTTPException(status_code=413, detail=f"At most {settings.TASKS_BULK_MAX} tasks per bulk request")
+
+# Items are validated one by one in the repository, so a single bad item is reported instead of failing the batch
+@router.post("/bulk", response_model=TaskBulkResponseSchema, status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk_endpoint(items: List[Any] = Body(...), db: AsyncSession = Depends(get_session)):
+    check_bulk_size(items)
+    try:
+        tasks, errors = await create_tasks_bulk(items, db)
+        return {"tasks": tasks, "errors": errors}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error creating tasks: {e}")
+
+@router.patch("/bulk", response_model=TaskBulkResponseSchema, status_code=status.HTTP_200_OK)
+async def update_tasks_bulk_endpoint(items: List[Any] = Body(...), db: AsyncSession = Depends(get_session)):
+    check_bulk_size(items)
+    try:
+        tasks, errors = await update_tasks_bulk(items, db)
+        return {"tasks": tasks, "errors": errors}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error updating tasks: {e}")
+
+async def check_write_result(task_id: int, result, if_match: Optional[str], db: AsyncSession):
+    if result is None:
+        if if_match and await get_task_version(task_id, db) is not None:
+            raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=f"Task with id {task_id} was modified")
+        raise HTTPException(status_code=404, detail=f"Task with id {task_id} not found")
+
 @router.put("/{task_id}", response_model=TaskResponseSchema, status_code=status.HTTP_200_OK)
-async def update_task_endpoint(task_id: int, updated_task: TaskUpdateSchema, db: AsyncSession = Depends(get_session)):
+async def update_task_endpoint(
+    task_id: int,
+    updated_task: TaskUpdateSchema,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_session),
+):
     try:
-        result = await update_task(task_id, updated_task, db)
-        return result
+        result = await update_task(task_id, updated_task, db, task_versions(if_match, task_id) if if_match else None)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error updating task with id {task_id}: {e}")
+    await check_write_result(task_id, result, if_match, db)
+    set_etag(response, task_etag(result.id, result.updated_at))
+    return result
+
+@router.patch("/{task_id}", response_model=TaskResponseSchema, status_code=status.HTTP_200_OK)
+async def patch_task_endpoint(
+    task_id: int,
+    patch: TaskPatchSchema,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_session),
+):
+    if not patch.model_fields_set:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    try:
+        result = await patch_task(task_id, patch, db, task_versions(if_match, task_id) if if_match else None)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error updating task with id {task_id}: {e}")
+    await check_write_result(task_id, result, if_match, db)
+    set_etag(response, task_etag(result.id, result.updated_at))
+    return result
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task_endpoint(task_id: int, db: AsyncSession = Depends(get_session)):
     try:
-        await delete_task(task_id, db)
+        result = await delete_task(task_id, db)
     except Exception as e:
-        raise HTTPException(status_code=404, detail=f"Error deleting task with id {task_id}: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=404, detail=f"Error deleting task with id {task_id}: {e}")
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Task with id {task_id} not found")
+
+@router.post("/print", response_model=PrintJobResponseSchema, status_code=status.HTTP_202_ACCEPTED)
+async def print_tasks_endpoint(print_request: PrintTasksSchema, db: AsyncSession = Depends(get_session)):
+    tasks = await get_tasks_by_ids(print_request.task_ids, db)
+    missing_ids = sorted(set(print_request.task_ids) - {task.id for task in tasks})
+    if missing_ids:
+        raise HTTPException(status_code=404, detail=f"Tasks not found: {missing_ids}")
+    if not tasks:
+        raise HTTPException(status_code=400, detail="No tasks to print")
+    return print_queue.enqueue(tasks)
+
+@router.post("/{task_id}/print", response_model=PrintJobResponseSchema, status_code=status.HTTP_202_ACCEPTED)
+async def print_task_endpoint(task_id: int, db: AsyncSession = Depends(get_session)):
+    task = await get_task_by_id(task_id, db)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Task with id {task_id} not found")
+    return print_queue.enqueue([task])
+
+@router.get("/print-jobs/{job_id}", response_model=PrintJobResponseSchema, status_code=status.HTTP_200_OK)
+async def get_print_job_endpoint(job_id: str):
+    job = print_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Print job {job_id} not found")
+    return job
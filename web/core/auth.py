@@ -5,7 +5,7 @@ from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from web.core.config import settings
-from web.core.security import generate_token, verify_password
+from web.core.security import generate_token, verify_password_async
 from web.models.user_model import UserModel
 from web.schemas.user_schema import UserLoginSchema
 from web.core.deps import get_session
@@ -17,7 +17,7 @@ async def authenticate_user(login_Data: UserLoginSchema, db: AsyncSession):
     if not user:
         return None
 
-    if not verify_password(login_Data.password, user.password):
+    if not await verify_password_async(login_Data.password, user.password):
         return None
       
     return user
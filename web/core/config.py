@@ -1,4 +1,4 @@
-from typing import List, ClassVar
+from typing import List, ClassVar, Optional
 from pydantic_settings import BaseSettings
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 
@@ -10,6 +10,38 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION: int
     ALLOWED_ORIGINS: List[str]
+    PRINT_WORKERS: int = 2
+    TASKS_PAGE_SIZE: int = 100
+    TASKS_PAGE_MAX: int = 500
+    TASKS_BULK_MAX: int = 1000
+    TASKS_EXPORT_BATCH: int = 1000
+    GZIP_MINIMUM_SIZE: int = 1024
+    GZIP_LEVEL: int = 5
+    # "memory" serves a single worker; "postgres" relays task events between workers with LISTEN/NOTIFY
+    TASK_EVENTS_BACKEND: str = "memory"
+    TASK_EVENTS_CHANNEL: str = "task_events"
+    # How often the postgres backend checks its LISTEN connection, and the longest wait between reconnect attempts
+    TASK_EVENTS_PING_INTERVAL: float = 30
+    TASK_EVENTS_RECONNECT_MAX: float = 30
+    TASK_STREAM_QUEUE_SIZE: int = 100
+    TASK_STREAM_KEEPALIVE: float = 15
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_SIZE: int = 1024
+    TASK_STATS_CACHE_TTL: int = 30
+    # Postgres text search configuration used for the task search index (stemming and stop words)
+    TASKS_SEARCH_CONFIG: str = "portuguese"
+    BCRYPT_MAX_CONCURRENCY: int = 4
+    # Each uvicorn worker has its own pool, so the database sees up to workers * (size + overflow) connections
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 500
+    # Request/query timing middleware and the Prometheus /metrics endpoint; /metrics is for admins, or for
+    # scrapers sending METRICS_TOKEN as a bearer token
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: Optional[str] = None
     
     DBBaseModel: ClassVar[DeclarativeMeta] = declarative_base()
 
@@ -1,8 +1,87 @@
+import threading
+import time
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from web.core.config import settings
 
-engine: AsyncEngine = create_async_engine(settings.DB_URL)
+class MonitoredQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that counts checkouts, checkouts that had to wait for a free connection, and timeouts."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics_lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self):
+        # Same condition QueuePool uses to decide it must block instead of opening an overflow connection
+        must_wait = self._max_overflow > -1 and self._overflow >= self._max_overflow and self._pool.empty()
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            with self.metrics_lock:
+                self.timeouts += 1
+            raise
+
+        waited = time.perf_counter() - started_at
+        with self.metrics_lock:
+            self.checkouts += 1
+            if must_wait:
+                self.waits += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        return connection
+
+    def stats(self) -> dict:
+        with self.metrics_lock:
+            return {
+                "size": self.size(),
+                "max_overflow": self._max_overflow,
+                "checked_in": self.checkedin(),
+                "checked_out": self.checkedout(),
+                # QueuePool counts overflow from -pool_size up; only connections beyond pool_size are overflow
+                "overflow": max(self.overflow(), 0),
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "wait_seconds_avg": self.wait_seconds_total / self.waits if self.waits else 0.0,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+
+def engine_options(url: str):
+    db_url = make_url(url)
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING, "pool_recycle": settings.DB_POOL_RECYCLE}
+
+    # An in-memory SQLite database only exists inside one connection, so it keeps SQLAlchemy's StaticPool
+    if db_url.get_backend_name() == "sqlite" and db_url.database in (None, "", ":memory:"):
+        return db_url, options
+
+    options.update(
+        poolclass=MonitoredQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    # asyncpg prepares every statement; the dialect keeps that many prepared statements per connection
+    if db_url.get_driver_name() == "asyncpg" and "prepared_statement_cache_size" not in db_url.query:
+        db_url = db_url.update_query_dict({"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)})
+    return db_url, options
+
+def pool_stats() -> dict:
+    pool = engine.sync_engine.pool
+    if isinstance(pool, MonitoredQueuePool):
+        return {"pool_class": type(pool).__name__, **pool.stats()}
+    return {"pool_class": type(pool).__name__, "status": pool.status()}
+
+engine_url, engine_kwargs = engine_options(settings.DB_URL)
+engine: AsyncEngine = create_async_engine(engine_url, **engine_kwargs)
 
 Session: AsyncSession = sessionmaker(
     autocommit=False,
@@ -10,4 +89,4 @@ Session: AsyncSession = sessionmaker(
     expire_on_commit=False,
     class_=AsyncSession,
     bind=engine
-)
\ No newline at end of file
+)
@@ -1,10 +1,13 @@
-from typing import Generator
+import hmac
+from typing import Generator, Optional
 
 from fastapi import Depends, HTTPException, status
 from jose.exceptions import JWTError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from web.core.cache import user_cache
+from web.core.config import settings
 from web.core.security import oauth2_scheme
 from web.core.database import Session
 from web.core.security import verify_token
@@ -31,10 +34,27 @@ async def get_current_user(db: AsyncSession = Depends(get_session), token: str =
         if user_email is None:
             raise credentials_exception
 
+        # Every protected request lands here, so the user row is served from memory until the TTL expires
+        user = user_cache.get(user_email)
+        if user is not None:
+            return user
+
         user = await get_user_by_email(user_email, db)
 
         if user is None:
             raise credentials_exception
+        user_cache.set(user_email, user)
         return user
     except JWTError as e:
-        raise credentials_exception
\ No newline at end of file
+        raise credentials_exception
+
+async def get_current_admin_user(current_user: UserModel = Depends(get_current_user)) -> UserModel:
+    if not current_user.is_admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required")
+    return current_user
+
+async def get_metrics_reader(db: AsyncSession = Depends(get_session), token: str = Depends(oauth2_scheme)) -> Optional[UserModel]:
+    # Prometheus cannot log in, so a configured scrape token is accepted in place of an admin's access token
+    if settings.METRICS_TOKEN and hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+        return None
+    return await get_current_admin_user(await get_current_user(db, token))
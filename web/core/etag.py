@@ -0,0 +1,52 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+
+def version_of(updated_at: datetime) -> int:
+    # SQLite hands back naive datetimes; every timestamp the API writes is UTC
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    delta = updated_at - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+def datetime_of(version: int) -> datetime:
+    seconds, microseconds = divmod(version, 1_000_000)
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(microsecond=microseconds)
+
+def task_etag(task_id: int, updated_at: datetime) -> str:
+    return f'W/"{task_id}-{version_of(updated_at)}"'
+
+def collection_etag(rows: Iterable[Tuple[int, datetime]], next_cursor: Optional[str]) -> str:
+    digest = hashlib.sha1()
+    for task_id, updated_at in rows:
+        digest.update(f"{task_id}:{version_of(updated_at)};".encode("ascii"))
+    digest.update((next_cursor or "").encode("ascii"))
+    return f'W/"{digest.hexdigest()}"'
+
+def parse_etags(header: Optional[str]) -> List[str]:
+    """Splits an If-Match/If-None-Match header into opaque tags, dropping the weak prefix (weak comparison)."""
+    if not header:
+        return []
+    tags = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag:
+            tags.append(tag)
+    return tags
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    tags = parse_etags(header)
+    return "*" in tags or parse_etags(etag)[0] in tags
+
+def task_versions(header: Optional[str], task_id: int) -> Optional[List[datetime]]:
+    """The updated_at values an If-Match header accepts for a task, or None when it accepts any ("*")."""
+    versions = []
+    for tag in parse_etags(header):
+        if tag == "*":
+            return None
+        tagged_id, _, version = tag.strip('"').partition("-")
+        if tagged_id == str(task_id) and version.isdigit():
+            versions.append(datetime_of(int(version)))
+    return versions
@@ -0,0 +1,214 @@
+import asyncio
+import itertools
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy.engine import make_url
+
+from web.core.config import settings
+from web.schemas.task_schema import TaskResponseSchema
+
+logger = logging.getLogger(__name__)
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+class Subscription:
+    def __init__(self, max_queue: int):
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max_queue)
+        self.dropped = False
+
+class TaskBroadcaster:
+    """Fans task change events out to every open stream of this process.
+
+    Each subscriber gets a bounded queue. A subscriber that falls that far behind is dropped instead of
+    buffering without limit or slowing the writers down; its stream ends and the client resyncs with GET /tasks.
+    """
+
+    def __init__(self, max_queue: int):
+        self.max_queue = max_queue
+        self.subscribers: Set[Subscription] = set()
+        self.ids = itertools.count(1)
+        self.dropped = 0
+
+    @asynccontextmanager
+    async def subscribe(self):
+        subscription = Subscription(self.max_queue)
+        self.subscribers.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self.subscribers.discard(subscription)
+
+    def deliver(self, event: Dict[str, Any]):
+        event = {**event, "seq": next(self.ids)}
+        for subscription in list(self.subscribers):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.dropped = True
+                self.subscribers.discard(subscription)
+                self.dropped += 1
+
+    def drop_all(self):
+        for subscription in list(self.subscribers):
+            subscription.dropped = True
+            self.dropped += 1
+        self.subscribers.clear()
+
+    def stats(self) -> dict:
+        return {"subscribers": len(self.subscribers), "dropped": self.dropped}
+
+class InProcessBackend:
+    """Delivers events straight to this process' subscribers; enough for a single uvicorn worker."""
+
+    def __init__(self, broadcaster: TaskBroadcaster):
+        self.broadcaster = broadcaster
+
+    @property
+    def has_listeners(self) -> bool:
+        return bool(self.broadcaster.subscribers)
+
+    async def start(self):
+        pass
+
+    async def publish(self, events: List[Dict[str, Any]]):
+        for event in events:
+            self.broadcaster.deliver(event)
+
+    async def stop(self):
+        pass
+
+class PostgresNotifyBackend:
+    """Relays events through Postgres NOTIFY, so streams on every worker and host see every write.
+
+    One dedicated asyncpg connection per process LISTENs on the channel and also sends the NOTIFYs. It is opened
+    on the first subscriber or write; a watcher task checks it and reconnects with backoff when it drops.
+    """
+
+    def __init__(self, broadcaster: TaskBroadcaster, channel: str):
+        self.broadcaster = broadcaster
+        self.channel = channel
+        self.connection = None
+        self.lost: Optional[asyncio.Event] = None
+        self.watcher: Optional[asyncio.Task] = None
+        self.lock = asyncio.Lock()
+        # asyncpg runs one query at a time per connection
+        self.query_lock = asyncio.Lock()
+
+    @property
+    def has_listeners(self) -> bool:
+        # Subscribers may live in other processes, so every write is announced
+        return True
+
+    async def start(self):
+        async with self.lock:
+            # Once connected, the watcher owns the connection and replaces it when it drops
+            if self.watcher is not None and not self.watcher.done():
+                return
+            self.connection = await self._connect()
+            self.watcher = asyncio.create_task(self._watch())
+
+    async def _connect(self):
+        import asyncpg
+
+        dsn = make_url(settings.DB_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+        connection = await asyncpg.connect(dsn)
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        await connection.add_listener(self.channel, self._on_notify)
+        self.lost = lost
+        return connection
+
+    async def _alive(self) -> bool:
+        # An idle connection cut by the network or a proxy is only noticed on the next round trip
+        try:
+            await asyncio.wait_for(self.lost.wait(), settings.TASK_EVENTS_PING_INTERVAL)
+            return False
+        except asyncio.TimeoutError:
+            pass
+        try:
+            async with self.query_lock:
+                await asyncio.wait_for(self.connection.fetchval("SELECT 1"), settings.TASK_EVENTS_PING_INTERVAL)
+            return True
+        except Exception:
+            return False
+
+    async def _watch(self):
+        while True:
+            while await self._alive():
+                pass
+
+            logger.warning("Lost the LISTEN connection on channel %s, reconnecting", self.channel)
+            self.connection.terminate()
+            # Notifications sent while disconnected are gone, so open streams end and their clients refetch
+            self.broadcaster.drop_all()
+
+            delay = 0.5
+            while True:
+                try:
+                    self.connection = await self._connect()
+                    break
+                except Exception as e:
+                    logger.warning("Could not reconnect to channel %s (%s), retrying in %.1fs", self.channel, e, delay)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, settings.TASK_EVENTS_RECONNECT_MAX)
+            logger.info("Listening on channel %s again", self.channel)
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            self.broadcaster.deliver(json.loads(payload))
+        except ValueError:
+            logger.warning("Ignoring malformed task event on channel %s", channel)
+
+    async def publish(self, events: List[Dict[str, Any]]):
+        await self.start()
+        # NOTIFY payloads are capped at 8000 bytes, one notification per task stays well below that
+        async with self.query_lock:
+            await self.connection.executemany(
+                "SELECT pg_notify($1, $2)", [(self.channel, json.dumps(event)) for event in events]
+            )
+
+    async def stop(self):
+        if self.watcher is not None:
+            self.watcher.cancel()
+            self.watcher = None
+        if self.connection is not None:
+            await self.connection.close()
+            self.connection = None
+
+def create_backend(broadcaster: TaskBroadcaster):
+    match settings.TASK_EVENTS_BACKEND:
+        case "memory":
+            return InProcessBackend(broadcaster)
+        case "postgres":
+            return PostgresNotifyBackend(broadcaster, settings.TASK_EVENTS_CHANNEL)
+        case _:
+            raise ValueError(f"Unknown task events backend '{settings.TASK_EVENTS_BACKEND}'")
+
+task_broadcaster = TaskBroadcaster(settings.TASK_STREAM_QUEUE_SIZE)
+task_events = create_backend(task_broadcaster)
+
+async def publish_task_events(event_type: str, tasks: List[Any]):
+    """Announces committed task writes. Failures are logged, the write itself already succeeded."""
+    if not tasks or not task_events.has_listeners:
+        return
+    try:
+        if event_type == DELETED:
+            events = [{"type": event_type, "task": {"id": task.id}} for task in tasks]
+        else:
+            events = [
+                {"type": event_type, "task": TaskResponseSchema.model_validate(task).model_dump(mode="json")}
+                for task in tasks
+            ]
+        await task_events.publish(events)
+    except Exception:
+        logger.exception("Could not publish %s task events", event_type)
+
+def format_sse(event: Optional[Dict[str, Any]], comment: Optional[str] = None) -> str:
+    if event is None:
+        return f": {comment or ''}\n\n"
+    return f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event['task'], ensure_ascii=False)}\n\n"
@@ -0,0 +1,42 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, Iterable, List
+
+from web.models.task_model import TaskModel
+
+EXPORT_COLUMNS: List[str] = [column.name for column in TaskModel.__table__.columns]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+def export_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def export_record(row) -> dict:
+    return {column: export_value(row[column]) for column in EXPORT_COLUMNS}
+
+async def ndjson_chunks(batches: AsyncIterator[Iterable]) -> AsyncIterator[str]:
+    async for rows in batches:
+        yield "".join(json.dumps(export_record(row), ensure_ascii=False) + "\n" for row in rows)
+
+async def csv_chunks(batches: AsyncIterator[Iterable]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    async for rows in batches:
+        writer.writerows(export_record(row) for row in rows)
+        # One chunk per batch, the buffer is emptied each time so memory stays bounded by the batch size
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,148 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+# Seconds; covers cache hits (sub-millisecond) up to bcrypt logins and large exports
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+class Histogram:
+    """Prometheus-style histogram with one series per label tuple."""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self.series: Dict[Tuple[str, ...], list] = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            series = self.series.get(labels)
+            if series is None:
+                # Per-bucket counts (last slot is +Inf), then sum and count
+                series = self.series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            snapshot = {labels: (list(counts), total, count) for labels, (counts, total, count) in self.series.items()}
+        for labels, (counts, total, count) in sorted(snapshot.items()):
+            label_text = ",".join(f'{name}="{escape(value)}"' for name, value in zip(self.label_names, labels))
+            prefix = f"{label_text}," if label_text else ""
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{self.name}_bucket{{{prefix}le="{le}"}} {cumulative}')
+            suffix = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{self.name}_sum{suffix} {total}")
+            lines.append(f"{self.name}_count{suffix} {count}")
+        return "\n".join(lines)
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def sample(name: str, documentation: str, value: float, kind: str = "gauge") -> str:
+    return f"# HELP {name} {documentation}\n# TYPE {name} {kind}\n{name} {value}"
+
+http_request_duration = Histogram(
+    "smtt_http_request_duration_seconds", "HTTP request latency by route.", ("method", "route", "status"), LATENCY_BUCKETS
+)
+http_request_queries = Histogram(
+    "smtt_http_request_db_queries", "Database queries issued per HTTP request.", ("method", "route"), (0, 1, 2, 3, 5, 10, 25, 50)
+)
+db_query_duration = Histogram("smtt_db_query_duration_seconds", "Database statement execution time.", (), QUERY_BUCKETS)
+
+class RequestQueries:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+# Set by MetricsMiddleware for the duration of a request; SQLAlchemy runs the cursor calls of an async
+# session in a greenlet that shares the request task's context, so the engine hooks can see it
+request_queries: ContextVar[Optional[RequestQueries]] = ContextVar("request_queries", default=None)
+
+def instrument_engine(sync_engine):
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+        db_query_duration.observe(elapsed)
+        queries = request_queries.get()
+        if queries is not None:
+            queries.count += 1
+            queries.seconds += elapsed
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        started = exception_context.connection.info.get("query_started_at") if exception_context.connection else None
+        if started:
+            started.pop()
+
+class MetricsMiddleware:
+    """Times every HTTP request per route template and counts the database queries it issued.
+
+    Also answers with a Server-Timing header, so the browser dev tools show app and database time per request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries()
+        token = request_queries.set(queries)
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                server_timing = f'app;dur={elapsed_ms:.1f}, db;dur={queries.seconds * 1000:.1f};desc="{queries.count} queries"'
+                message.setdefault("headers", []).append((b"server-timing", server_timing.encode("ascii")))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_queries.reset(token)
+            route = scope.get("route")
+            # Route templates keep the label set small, raw paths would create a series per task id
+            route_path = getattr(route, "path", "unmatched")
+            http_request_duration.observe(time.perf_counter() - started_at, scope["method"], route_path, str(status_code))
+            http_request_queries.observe(queries.count, scope["method"], route_path)
+
+def render_metrics() -> str:
+    from web.core.cache import task_stats_cache, user_cache
+    from web.core.database import pool_stats
+    from web.core.events import task_broadcaster
+
+    sections = [http_request_duration.render(), http_request_queries.render(), db_query_duration.render()]
+    pool = pool_stats()
+    if "checked_out" in pool:
+        sections.append(sample("smtt_db_pool_checked_out", "Connections currently checked out of the pool.", pool["checked_out"]))
+        sections.append(sample("smtt_db_pool_overflow", "Overflow connections currently open.", pool["overflow"]))
+        sections.append(sample("smtt_db_pool_waits_total", "Checkouts that waited for a free connection.", pool["waits"], "counter"))
+        sections.append(sample("smtt_db_pool_timeouts_total", "Checkouts that timed out.", pool["timeouts"], "counter"))
+    sections.append(sample("smtt_user_cache_hit_rate", "Authenticated user cache hit rate.", user_cache.stats()["hit_rate"]))
+    sections.append(sample("smtt_task_stats_cache_hit_rate", "Task stats cache hit rate.", task_stats_cache.stats()["hit_rate"]))
+    sections.append(sample("smtt_task_stream_subscribers", "Open task change streams.", task_broadcaster.stats()["subscribers"]))
+    return "\n".join(sections) + "\n"
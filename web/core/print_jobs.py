@@ -0,0 +1,107 @@
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+from web.core.config import settings
+from web.models.task_model import TaskModel, TaskPriority, TaskStatus
+
+# The renderer and spooler live in the CLI, whose modules import each other from cli/src
+CLI_SRC = Path(__file__).resolve().parents[2] / "cli" / "src"
+if str(CLI_SRC) not in sys.path:
+    sys.path.append(str(CLI_SRC))
+
+from device.spooler import DONE, get_spooler
+from ticket.html_generator import generate_ticket
+
+# Same emoji/urgency pairs the front end shows in its ticket preview
+PRIORITY_TICKETS = {
+    TaskPriority.URGENT: ("🚨", "Urgente"),
+    TaskPriority.HIGH: ("⚠️", "Alta"),
+    TaskPriority.MEDIUM: ("❗", "Média"),
+    TaskPriority.LOW: ("🐢", "Baixa"),
+}
+
+FINISHED_JOBS_KEPT = 1000
+
+def task_to_ticket(task: TaskModel) -> dict:
+    emoji, urgency = PRIORITY_TICKETS.get(task.priority, PRIORITY_TICKETS[TaskPriority.MEDIUM])
+    if task.status == TaskStatus.COMPLETED:
+        emoji, urgency = "✅", "Concluída"
+
+    due_date, due_hour = "Não definido", ""
+    if task.due_datetime:
+        local_due = task.due_datetime.astimezone()
+        due_date, due_hour = local_due.strftime("%d/%m/%Y"), local_due.strftime("%H:%M")
+
+    return {"emoji": emoji, "urgency": urgency, "task": task.title, "due_date": due_date, "due_hour": due_hour}
+
+class PrintJob:
+    def __init__(self, task_ids: List[int]):
+        self.job_id = uuid.uuid4().hex
+        self.task_ids = task_ids
+        self.status = "queued"
+        self.printed = 0
+        self.error = None
+        self.created_at = datetime.now(timezone.utc)
+        self.finished_at = None
+
+class PrintJobQueue:
+    def __init__(self, workers: int):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="print-job")
+        self.jobs: "OrderedDict[str, PrintJob]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def enqueue(self, tasks: List[TaskModel]) -> PrintJob:
+        job = PrintJob([task.id for task in tasks])
+        tickets = [task_to_ticket(task) for task in tasks]
+        with self.lock:
+            self.jobs[job.job_id] = job
+            # Oldest finished jobs go first; unfinished ones are skipped so a stuck job cannot block eviction
+            excess = len(self.jobs) - FINISHED_JOBS_KEPT
+            if excess > 0:
+                finished = [job_id for job_id, known in self.jobs.items() if known.finished_at is not None]
+                for job_id in finished[:excess]:
+                    del self.jobs[job_id]
+        # Rendering and the printer transfer block, so they run on worker threads instead of the event loop
+        self.executor.submit(self._run, job, tickets)
+        return job
+
+    def get(self, job_id: str):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def _run(self, job: PrintJob, tickets: List[dict]):
+        try:
+            job.status = "rendering"
+            images = []
+            for ticket in tickets:
+                image = generate_ticket(ticket)
+                if image is None:
+                    raise RuntimeError(f"Could not render ticket for '{ticket['task']}'")
+                images.append(image)
+
+            job.status = "printing"
+            spooler = get_spooler()
+            spool_jobs = [spooler.submit_image(image, block=True) for image in images]
+            for spool_job in spool_jobs:
+                spool_job.wait()
+            # The CLI drains finished spooler jobs when it reports them to the user; nothing reports them here,
+            # so without this every ticket printed through the API would stay in memory
+            spooler.pop_finished()
+
+            job.printed = sum(1 for spool_job in spool_jobs if spool_job.status == DONE)
+            failed = [spool_job for spool_job in spool_jobs if spool_job.status != DONE]
+            job.status = "failed" if failed else "done"
+            job.error = failed[0].error if failed else None
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+
+print_queue = PrintJobQueue(settings.PRINT_WORKERS)
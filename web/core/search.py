@@ -0,0 +1,99 @@
+import re
+from typing import Optional
+
+from sqlalchemy import cast, column, func, inspect, literal, literal_column, select, table, text
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+from web.core.config import settings
+from web.models.task_model import TaskModel
+
+FTS_TABLE = "tasks_fts"
+fts_table = table(FTS_TABLE, column("rowid"))
+
+SQLITE_SEARCH_DDL = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, description, content='tasks', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )""",
+    # External content tables are not maintained by SQLite itself, these triggers keep the index in sync
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+def postgres_search_ddl():
+    config = settings.TASKS_SEARCH_CONFIG
+    return [
+        # A generated column is kept up to date by Postgres on every write, titles weigh more than descriptions
+        f"""ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('{config}', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('{config}', coalesce(description, '')), 'B')
+        ) STORED""",
+        "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING GIN (search_vector)",
+    ]
+
+def create_search_index(connection) -> None:
+    """Creates the full-text index over task titles and descriptions for the connection's database."""
+    match connection.dialect.name:
+        case "sqlite":
+            if inspect(connection).has_table(FTS_TABLE):
+                return
+            for statement in SQLITE_SEARCH_DDL:
+                connection.execute(text(statement))
+        case "postgresql":
+            for statement in postgres_search_ddl():
+                connection.execute(text(statement))
+
+def drop_search_index(connection) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+
+def fts5_query(q: str) -> Optional[str]:
+    # Every word must match, as a prefix so results show up while the user is still typing;
+    # quoting keeps FTS5 operators and punctuation in the input from being interpreted
+    words = re.findall(r"\w+", q)
+    return " ".join(f'"{word}"*' for word in words) or None
+
+def build_search_query(dialect_name: str, q: str):
+    """Task columns matching `q`, best match first. Returns None when `q` has nothing to search for."""
+    columns = TaskModel.__table__.columns
+    match dialect_name:
+        case "sqlite":
+            match_expression = fts5_query(q)
+            if match_expression is None:
+                return None
+            # bm25 is lower for better matches; title hits count twice as much as description hits
+            rank = func.bm25(literal_column(FTS_TABLE), 2.0, 1.0)
+            return (
+                select(*columns)
+                .join_from(TaskModel, fts_table, fts_table.c.rowid == TaskModel.id)
+                .where(literal_column(FTS_TABLE).op("MATCH")(match_expression))
+                .order_by(rank, TaskModel.id.desc())
+            )
+        case "postgresql":
+            if not q.strip():
+                return None
+            search_vector = literal_column("tasks.search_vector")
+            query = func.websearch_to_tsquery(cast(literal(settings.TASKS_SEARCH_CONFIG), REGCONFIG), q)
+            return (
+                select(*columns)
+                .where(search_vector.op("@@")(query))
+                .order_by(func.ts_rank_cd(search_vector, query).desc(), TaskModel.id.desc())
+            )
+        case _:
+            # No text index on other databases, fall back to a plain substring match
+            pattern = f"%{q.strip()}%"
+            if pattern == "%%":
+                return None
+            return (
+                select(*columns)
+                .where(TaskModel.title.ilike(pattern) | TaskModel.description.ilike(pattern))
+                .order_by(TaskModel.created_at.desc(), TaskModel.id.desc())
+            )
@@ -1,3 +1,6 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from web.core.config import settings
@@ -5,12 +8,63 @@ from jose import jwt
 
 CRYPTO = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt costs ~200ms of CPU per call, so it runs on its own bounded pool instead of the event loop
+BCRYPT_EXECUTOR = ThreadPoolExecutor(max_workers=settings.BCRYPT_MAX_CONCURRENCY, thread_name_prefix="bcrypt")
+BCRYPT_SLOTS = asyncio.Semaphore(settings.BCRYPT_MAX_CONCURRENCY)
+
+class BcryptMetrics:
+    def __init__(self):
+        self.calls = 0
+        self.waiting = 0
+        self.queue_seconds_total = 0.0
+        self.queue_seconds_max = 0.0
+        self.run_seconds_total = 0.0
+
+    def record_queue_time(self, seconds: float) -> None:
+        self.calls += 1
+        self.queue_seconds_total += seconds
+        self.queue_seconds_max = max(self.queue_seconds_max, seconds)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "waiting": self.waiting,
+            "queue_seconds_avg": self.queue_seconds_total / self.calls if self.calls else 0.0,
+            "queue_seconds_max": self.queue_seconds_max,
+            "run_seconds_avg": self.run_seconds_total / self.calls if self.calls else 0.0,
+        }
+
+bcrypt_metrics = BcryptMetrics()
+
+async def run_bcrypt(function, *args):
+    queued_at = time.perf_counter()
+    bcrypt_metrics.waiting += 1
+    try:
+        await BCRYPT_SLOTS.acquire()
+    finally:
+        bcrypt_metrics.waiting -= 1
+
+    try:
+        started_at = time.perf_counter()
+        bcrypt_metrics.record_queue_time(started_at - queued_at)
+        result = await asyncio.get_running_loop().run_in_executor(BCRYPT_EXECUTOR, function, *args)
+        bcrypt_metrics.run_seconds_total += time.perf_counter() - started_at
+        return result
+    finally:
+        BCRYPT_SLOTS.release()
+
 def hash_password(password: str) -> str:
     return CRYPTO.hash(password)
 
 def verify_password(password: str, hashed_password: str) -> bool:
     return CRYPTO.verify(password, hashed_password)
 
+async def hash_password_async(password: str) -> str:
+    return await run_bcrypt(hash_password, password)
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    return await run_bcrypt(verify_password, password, hashed_password)
+
 def generate_token(data: dict) -> str:
     return jwt.encode(data, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
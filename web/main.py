@@ -1,8 +1,12 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from web.core.config import settings
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse
 from web.api.api import api_router
+from web.core.database import engine
+from web.core.deps import get_metrics_reader
+from web.core.metrics import MetricsMiddleware, instrument_engine, render_metrics
 import uvicorn
 
 app = FastAPI(title=settings.PROJECT_NAME, version="BETA")
@@ -13,9 +17,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],
 )
 
+# Task pages are repetitive JSON and shrink several times over; small bodies are not worth the CPU,
+# and past level 5 the extra compression costs more time than it saves on the wire
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE, compresslevel=settings.GZIP_LEVEL)
+
+# Added last so it wraps the other middleware and its timings include compression
+if settings.METRICS_ENABLED:
+    instrument_engine(engine.sync_engine)
+    app.add_middleware(MetricsMiddleware)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False, dependencies=[Depends(get_metrics_reader)])
+    async def metrics():
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     uvicorn.run("web.main:app", host="0.0.0.0", port=8000, log_level="info", reload=True)
\ No newline at end of file
@@ -1,6 +1,6 @@
 from datetime import datetime
 from web.core.config import settings
-from sqlalchemy import Column, ForeignKey, Integer, String, Enum, TIMESTAMP
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Enum, TIMESTAMP
 from enum import Enum as PyEnum
 from typing import Optional
 
@@ -27,6 +27,15 @@ class TaskCategory(PyEnum):
 
 class TaskModel(settings.DBBaseModel):
     __tablename__ = "tasks"
+    # Matches the list endpoint: newest first with keyset pagination, optionally narrowed by status/priority,
+    # plus per-assignee boards grouped by status and ordered by due date
+    __table_args__ = (
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_tasks_priority_created_at_id", "priority", "created_at", "id"),
+        Index("ix_tasks_assignee_status_due", "assigneeId", "status", "due_datetime"),
+        Index("ix_tasks_due_datetime", "due_datetime"),
+    )
     id: int = Column(Integer, default=None, primary_key=True, index=True, autoincrement=True, nullable=False)
     title: str = Column(String(200), nullable=False)
     description: str = Column(String(200))
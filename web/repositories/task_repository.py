@@ -1,11 +1,29 @@
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import Depends
-from sqlalchemy import select
-from web.models.task_model import TaskModel
-from web.schemas.task_schema import TaskCreateSchema, TaskUpdateSchema
+from pydantic import ValidationError
+from sqlalchemy import case, delete, func, insert, select, tuple_, update
+from web.models.task_model import TaskCategory, TaskModel, TaskPriority, TaskStatus
+from web.models.user_model import UserModel
+from web.schemas.task_schema import (
+    TaskBulkUpdateItemSchema,
+    TaskCreateSchema,
+    TaskFilterSchema,
+    TaskPatchSchema,
+    TaskUpdateSchema,
+)
+from web.core.cache import task_stats_cache
+from web.core.database import Session
 from web.core.deps import get_session
+from web.core.events import CREATED, DELETED, UPDATED, publish_task_events
+from web.core.pagination import decode_cursor, encode_cursor, encode_offset_cursor
+from web.core.search import build_search_query
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 
+async def task_written(event_type: str, tasks: List[TaskModel]):
+    task_stats_cache.clear()
+    await publish_task_events(event_type, tasks)
+
 async def create_task(task: TaskCreateSchema, db: AsyncSession = Depends(get_session)):
     datetime_now = datetime.now(timezone.utc)
     new_task = TaskModel(
@@ -23,18 +41,278 @@ async def create_task(task: TaskCreateSchema, db: AsyncSession = Depends(get_ses
         db.add(new_task)
         await db.commit()
         await db.refresh(new_task)
-        return new_task
     except Exception as e:
         await db.rollback()
         raise e
+    await task_written(CREATED, [new_task])
+    return new_task
+
+def validation_error_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'body'}: {detail['msg']}" for detail in error.errors()
+    )
+
+async def find_missing_assignees(assignee_ids: set, db: AsyncSession) -> set:
+    if not assignee_ids:
+        return set()
+    result = await db.execute(select(UserModel.id).where(UserModel.id.in_(assignee_ids)))
+    return assignee_ids - set(result.scalars().all())
+
+async def create_tasks_bulk(items: List[Any], db: AsyncSession = Depends(get_session)):
+    """Validates every item, then inserts the valid ones with a single multi-row INSERT ... RETURNING.
+
+    Returns the created tasks in input order and a list of `{index, error}` for the rejected items.
+    """
+    errors = []
+    valid: List[Tuple[int, TaskCreateSchema]] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, TaskCreateSchema.model_validate(item)))
+        except ValidationError as e:
+            errors.append({"index": index, "id": None, "error": validation_error_message(e)})
+
+    # One lookup for all assignees instead of letting a foreign key failure abort the whole transaction
+    missing_assignees = await find_missing_assignees({task.assigneeId for _, task in valid if task.assigneeId}, db)
+    if missing_assignees:
+        errors.extend(
+            {"index": index, "id": None, "error": f"Assignee with id {task.assigneeId} not found"}
+            for index, task in valid if task.assigneeId in missing_assignees
+        )
+        valid = [(index, task) for index, task in valid if task.assigneeId not in missing_assignees]
+
+    if not valid:
+        return [], sorted(errors, key=lambda error: error["index"])
+
+    datetime_now = datetime.now(timezone.utc)
+    rows = [{**task.model_dump(), "created_at": datetime_now, "updated_at": datetime_now} for _, task in valid]
+    try:
+        result = await db.execute(insert(TaskModel).returning(TaskModel, sort_by_parameter_order=True), rows)
+        tasks = result.scalars().all()
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise e
+    await task_written(CREATED, tasks)
+    return tasks, sorted(errors, key=lambda error: error["index"])
+
+async def update_tasks_bulk(items: List[Any], db: AsyncSession = Depends(get_session)):
+    """Applies partial updates to many tasks in one transaction.
+
+    Only the fields present in each item are written. Unknown ids, duplicated ids and invalid items are
+    reported per index and skipped; the remaining rows are updated with one executemany UPDATE by primary key.
+    """
+    errors = []
+    valid: List[Tuple[int, TaskBulkUpdateItemSchema]] = []
+    seen_ids = set()
+    for index, item in enumerate(items):
+        item_id = item.get("id") if isinstance(item, dict) else None
+        try:
+            patch = TaskBulkUpdateItemSchema.model_validate(item)
+        except ValidationError as e:
+            errors.append({"index": index, "id": item_id if isinstance(item_id, int) else None, "error": validation_error_message(e)})
+            continue
+        if patch.id in seen_ids:
+            errors.append({"index": index, "id": patch.id, "error": f"Task with id {patch.id} appears more than once"})
+            continue
+        seen_ids.add(patch.id)
+        valid.append((index, patch))
+
+    if valid:
+        # Locked until commit, so another request cannot delete a checked row before the UPDATE runs
+        result = await db.execute(select(TaskModel.id).where(TaskModel.id.in_(seen_ids)).with_for_update())
+        existing_ids = set(result.scalars().all())
+        missing_assignees = await find_missing_assignees(
+            {patch.assigneeId for _, patch in valid if patch.assigneeId and "assigneeId" in patch.model_fields_set}, db
+        )
+
+        checked = []
+        for index, patch in valid:
+            if patch.id not in existing_ids:
+                errors.append({"index": index, "id": patch.id, "error": f"Task with id {patch.id} not found"})
+            elif patch.assigneeId in missing_assignees and "assigneeId" in patch.model_fields_set:
+                errors.append({"index": index, "id": patch.id, "error": f"Assignee with id {patch.assigneeId} not found"})
+            else:
+                checked.append((index, patch))
+        valid = checked
+
+    errors.sort(key=lambda error: error["index"])
+    if not valid:
+        return [], errors
+
+    datetime_now = datetime.now(timezone.utc)
+    rows = [{**patch.model_dump(exclude_unset=True), "updated_at": datetime_now} for _, patch in valid]
+    try:
+        # Bulk UPDATE by primary key has no RETURNING, so the new rows come back in one SELECT afterwards
+        await db.execute(update(TaskModel), rows)
+        result = await db.execute(
+            select(TaskModel)
+            .where(TaskModel.id.in_([patch.id for _, patch in valid]))
+            .execution_options(populate_existing=True)
+        )
+        tasks = {task.id: task for task in result.scalars().all()}
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+    # The response is built from the rows read back, a row that is gone anyway is reported instead of failing
+    # a request whose other writes are already committed
+    updated = []
+    for index, patch in valid:
+        if patch.id in tasks:
+            updated.append(tasks[patch.id])
+        else:
+            errors.append({"index": index, "id": patch.id, "error": f"Task with id {patch.id} not found"})
+    errors.sort(key=lambda error: error["index"])
+    await task_written(UPDATED, updated)
+    return updated, errors
+
+def apply_task_filters(query, filters: Optional[TaskFilterSchema]):
+    if filters is None:
+        return query
+    if filters.status is not None:
+        query = query.where(TaskModel.status == filters.status)
+    if filters.priority is not None:
+        query = query.where(TaskModel.priority == filters.priority)
+    if filters.category is not None:
+        query = query.where(TaskModel.category == filters.category)
+    if filters.assigneeId is not None:
+        query = query.where(TaskModel.assigneeId == filters.assigneeId)
+    if filters.due_from is not None:
+        query = query.where(TaskModel.due_datetime >= filters.due_from)
+    if filters.due_to is not None:
+        query = query.where(TaskModel.due_datetime < filters.due_to)
+    if filters.created_from is not None:
+        query = query.where(TaskModel.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        query = query.where(TaskModel.created_at < filters.created_to)
+    return query
+
+def build_tasks_query(filters: Optional[TaskFilterSchema] = None, cursor: Optional[str] = None, limit: int = 100, columns=None):
+    query = apply_task_filters(select(*columns) if columns else select(TaskModel), filters)
+    if cursor:
+        # Keyset pagination: continue strictly after the last (created_at, id) of the previous page
+        created_at, task_id = decode_cursor(cursor)
+        query = query.where(tuple_(TaskModel.created_at, TaskModel.id) < tuple_(created_at, task_id))
+
+    # One extra row tells whether there is a next page without a COUNT query
+    return query.order_by(TaskModel.created_at.desc(), TaskModel.id.desc()).limit(limit + 1)
+
+def split_page(rows, limit: int):
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+    return rows, None
+
+async def get_tasks(
+    db: AsyncSession = Depends(get_session),
+    filters: Optional[TaskFilterSchema] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+):
+    """Returns one page of tasks as plain column dicts (not TaskModel objects) and the cursor of the next page.
+
+    Dicts skip ORM identity-map bookkeeping and validate several times faster than attribute access,
+    the list endpoint serializes the whole page in one batch.
+    """
+    try:
+        result = await db.execute(build_tasks_query(filters, cursor, limit, TaskModel.__table__.columns))
+        rows, next_cursor = split_page(result.all(), limit)
+        return [row._asdict() for row in rows], next_cursor
+    except Exception as e:
+        raise e
+
+async def get_tasks_versions(
+    db: AsyncSession = Depends(get_session),
+    filters: Optional[TaskFilterSchema] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+):
+    """Same page as get_tasks, but only (id, updated_at) pairs, enough to compute the page ETag."""
+    try:
+        columns = (TaskModel.id, TaskModel.created_at, TaskModel.updated_at)
+        result = await db.execute(build_tasks_query(filters, cursor, limit, columns))
+        rows, next_cursor = split_page(result.all(), limit)
+        return [(row.id, row.updated_at) for row in rows], next_cursor
+    except Exception as e:
+        raise e
+
+async def stream_tasks(filters: Optional[TaskFilterSchema] = None, batch_size: int = 1000):
+    """Yields lists of task rows from a server-side cursor, at most `batch_size` rows in memory at a time.
+
+    Plain column rows are selected instead of TaskModel objects so nothing piles up in the identity map.
+    The generator owns its session because it outlives the request dependency that would otherwise close it.
+    """
+    query = apply_task_filters(select(*TaskModel.__table__.columns), filters)
+    query = query.order_by(TaskModel.created_at.desc(), TaskModel.id.desc()).execution_options(yield_per=batch_size)
+    async with Session() as db:
+        result = await db.stream(query)
+        async for rows in result.mappings().partitions():
+            yield rows
 
-async def get_tasks(db: AsyncSession = Depends(get_session)):
+async def search_tasks(
+    q: str,
+    db: AsyncSession = Depends(get_session),
+    filters: Optional[TaskFilterSchema] = None,
+    offset: int = 0,
+    limit: int = 100,
+):
+    """Ranked full-text search over titles and descriptions, one page of column dicts plus the next page cursor."""
+    query = build_search_query(db.get_bind().dialect.name, q)
+    if query is None:
+        return [], None
     try:
-        result = await db.execute(select(TaskModel).order_by(TaskModel.created_at.desc()))
-        return result.scalars().all()
+        result = await db.execute(apply_task_filters(query, filters).offset(offset).limit(limit + 1))
+        rows = result.all()
     except Exception as e:
         raise e
 
+    next_cursor = encode_offset_cursor(offset + limit) if len(rows) > limit else None
+    return [row._asdict() for row in rows[:limit]], next_cursor
+
+async def get_task_stats(db: AsyncSession = Depends(get_session), filters: Optional[TaskFilterSchema] = None):
+    """Counts tasks per status, priority and category plus the overdue ones, in a single GROUP BY query."""
+    cache_key = filters.model_dump_json() if filters else None
+    stats = task_stats_cache.get(cache_key)
+    if stats is not None:
+        return stats
+
+    overdue = case(
+        (
+            (TaskModel.due_datetime < datetime.now(timezone.utc))
+            & TaskModel.status.notin_([TaskStatus.COMPLETED, TaskStatus.CANCELLED]),
+            1,
+        ),
+        else_=0,
+    )
+    query = apply_task_filters(
+        select(TaskModel.status, TaskModel.priority, TaskModel.category, func.count(), func.sum(overdue)),
+        filters,
+    ).group_by(TaskModel.status, TaskModel.priority, TaskModel.category)
+    try:
+        result = await db.execute(query)
+        rows = result.all()
+    except Exception as e:
+        raise e
+
+    stats = {
+        "total": 0,
+        "overdue": 0,
+        "by_status": dict.fromkeys((status.value for status in TaskStatus), 0),
+        "by_priority": dict.fromkeys((priority.value for priority in TaskPriority), 0),
+        "by_category": dict.fromkeys((category.value for category in TaskCategory), 0),
+    }
+    # At most statuses x priorities x categories groups come back, folding them is cheap
+    for status, priority, category, count, overdue_count in rows:
+        stats["total"] += count
+        stats["overdue"] += overdue_count or 0
+        stats["by_status"][status.value] += count
+        stats["by_priority"][priority.value] += count
+        stats["by_category"][category.value] += count
+
+    task_stats_cache.set(cache_key, stats)
+    return stats
+
 async def get_task_by_id(task_id: int, db: AsyncSession = Depends(get_session)):
     try:
         result = await db.execute(select(TaskModel).where(TaskModel.id == task_id))
@@ -42,32 +320,74 @@ async def get_task_by_id(task_id: int, db: AsyncSession = Depends(get_session)):
     except Exception as e:
         raise e
 
+async def get_task_version(task_id: int, db: AsyncSession = Depends(get_session)):
+    try:
+        result = await db.execute(select(TaskModel.updated_at).where(TaskModel.id == task_id))
+        return result.scalar_one_or_none()
+    except Exception as e:
+        raise e
+
+async def get_tasks_by_ids(task_ids: List[int], db: AsyncSession = Depends(get_session)):
+    try:
+        result = await db.execute(select(TaskModel).where(TaskModel.id.in_(task_ids)))
+        tasks = {task.id: task for task in result.scalars().all()}
+        return [tasks[task_id] for task_id in task_ids if task_id in tasks]
+    except Exception as e:
+        raise e
+
 async def delete_task(task_id: int, db: AsyncSession = Depends(get_session)):
     try:
-        result = await db.execute(select(TaskModel).where(TaskModel.id == task_id))
+        # One DELETE ... RETURNING instead of loading the row first; None means there was no such task
+        result = await db.execute(delete(TaskModel).where(TaskModel.id == task_id).returning(TaskModel))
         task = result.scalar_one_or_none()
-        await db.delete(task)
         await db.commit()
-        return task
     except Exception as e:
+        await db.rollback()
         raise e
+    if task is not None:
+        await task_written(DELETED, [task])
+    return task
 
-async def update_task(task_id: int, updated_task: TaskUpdateSchema, db: AsyncSession = Depends(get_session)):
-    datetime_now = datetime.now(timezone.utc)
+async def write_task_fields(
+    task_id: int,
+    values: Dict[str, Any],
+    db: AsyncSession,
+    expected_versions: Optional[List[datetime]] = None,
+):
+    values = {**values, "updated_at": datetime.now(timezone.utc)}
+    query = update(TaskModel).where(TaskModel.id == task_id)
+    if expected_versions is not None:
+        # Optimistic concurrency: the row is only written if nobody changed it since the client read it
+        query = query.where(TaskModel.updated_at.in_(expected_versions))
     try:
-        result = await db.execute(select(TaskModel).where(TaskModel.id == task_id))
+        # Only the given columns are written, and the new row comes back in the same round trip
+        result = await db.execute(
+            query
+            .values(**values)
+            .returning(TaskModel)
+            .execution_options(populate_existing=True)
+        )
         task = result.scalar_one_or_none()
-        task.title = updated_task.title
-        task.description = updated_task.description
-        task.due_datetime = updated_task.due_datetime
-        task.status = updated_task.status
-        task.priority = updated_task.priority
-        task.category = updated_task.category
-        task.assigneeId = updated_task.assigneeId
-        task.updated_at = datetime_now
         await db.commit()
-        await db.refresh(task)
-        return task
     except Exception as e:
         await db.rollback()
-        raise e
\ No newline at end of file
+        raise e
+    if task is not None:
+        await task_written(UPDATED, [task])
+    return task
+
+async def update_task(
+    task_id: int,
+    updated_task: TaskUpdateSchema,
+    db: AsyncSession = Depends(get_session),
+    expected_versions: Optional[List[datetime]] = None,
+):
+    return await write_task_fields(task_id, updated_task.model_dump(), db, expected_versions)
+
+async def patch_task(
+    task_id: int,
+    patch: TaskPatchSchema,
+    db: AsyncSession = Depends(get_session),
+    expected_versions: Optional[List[datetime]] = None,
+):
+    return await write_task_fields(task_id, patch.model_dump(exclude_unset=True), db, expected_versions)
@@ -3,7 +3,8 @@ from datetime import datetime, timezone
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from web.core.security import hash_password
+from web.core.cache import user_cache
+from web.core.security import hash_password_async
 from web.models.user_model import UserModel
 from web.schemas.user_schema import UserCreateSchema, UserUpdateSchema
 
@@ -20,13 +21,14 @@ async def create_user(user: UserCreateSchema, db: AsyncSession):
         new_user = UserModel(
             name=user.name,
             email=user.email,
-            password=hash_password(user.password),
+            password=await hash_password_async(user.password),
             created_at=datetime_now,
             updated_at=datetime_now
         )
         db.add(new_user)
         await db.commit()
         await db.refresh(new_user)
+        user_cache.invalidate(new_user.email)
         return new_user
     except Exception as e:
         await db.rollback()
@@ -39,11 +41,12 @@ async def update_user(user: UserUpdateSchema, db: AsyncSession):
         user = result.scalar_one_or_none()
         user.name = user.name
         user.email = user.email
-        user.password = hash_password(user.password)
+        user.password = await hash_password_async(user.password)
         user.is_active = user.is_active
         user.updated_at = datetime_now
         await db.commit()
         await db.refresh(user)
+        user_cache.invalidate(user.email)
         return user
     except Exception as e:
         await db.rollback()
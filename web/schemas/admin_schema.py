@@ -0,0 +1,9 @@
+from pydantic import BaseModel as SCBaseModel
+from typing import Any, Dict
+
+class AdminStatsSchema(SCBaseModel):
+    db_pool: Dict[str, Any]
+    user_cache: Dict[str, Any]
+    task_stats_cache: Dict[str, Any]
+    bcrypt: Dict[str, Any]
+    task_stream: Dict[str, Any]
@@ -0,0 +1,18 @@
+from pydantic import BaseModel as SCBaseModel
+from datetime import datetime
+from typing import List, Optional
+
+class PrintTasksSchema(SCBaseModel):
+    task_ids: List[int]
+
+class PrintJobResponseSchema(SCBaseModel):
+    job_id: str
+    status: str
+    task_ids: List[int]
+    printed: int
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
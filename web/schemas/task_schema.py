@@ -1,6 +1,6 @@
-from pydantic import BaseModel as SCBaseModel
+from pydantic import BaseModel as SCBaseModel, TypeAdapter, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 from web.models.task_model import TaskStatus, TaskPriority, TaskCategory
 
 class TaskCreateSchema(SCBaseModel):
@@ -34,4 +34,53 @@ class TaskResponseSchema(SCBaseModel):
     assigneeId: Optional[int] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Validates and serializes a whole page in one call inside pydantic-core, see the GET /tasks endpoint
+TaskListAdapter = TypeAdapter(List[TaskResponseSchema])
+
+class TaskFilterSchema(SCBaseModel):
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    category: Optional[TaskCategory] = None
+    assigneeId: Optional[int] = None
+    due_from: Optional[datetime] = None
+    due_to: Optional[datetime] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+class TaskPatchSchema(SCBaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    due_datetime: Optional[datetime] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    category: Optional[TaskCategory] = None
+    assigneeId: Optional[int] = None
+
+    @model_validator(mode="after")
+    def reject_null_required_fields(self):
+        # Omitted fields are left untouched, but these columns can never be set to null
+        for field in ("title", "description", "status", "priority", "category"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+class TaskBulkUpdateItemSchema(TaskPatchSchema):
+    id: int
+
+class TaskBulkErrorSchema(SCBaseModel):
+    index: int
+    id: Optional[int] = None
+    error: str
+
+class TaskBulkResponseSchema(SCBaseModel):
+    tasks: List[TaskResponseSchema]
+    errors: List[TaskBulkErrorSchema]
+
+class TaskStatsSchema(SCBaseModel):
+    total: int
+    overdue: int
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+    by_category: Dict[str, int]
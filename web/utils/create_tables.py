@@ -1,5 +1,12 @@
 from web.core.database import engine
 from web.core.config import settings
+from web.core.search import create_search_index, drop_search_index
+
+def create_missing_indexes(connection) -> None:
+    # create_all only creates indexes together with new tables, existing tables need them added one by one
+    for table in settings.DBBaseModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
 async def create_tables() -> None:
     import web.models.__all_models
@@ -7,6 +14,8 @@ async def create_tables() -> None:
     async with engine.begin() as conn:
         # Only create tables that don't exist (safer - won't drop existing data)
         await conn.run_sync(settings.DBBaseModel.metadata.create_all)
+        await conn.run_sync(create_missing_indexes)
+        await conn.run_sync(create_search_index)
         print("Tables created successfully")
         await conn.commit()
 
@@ -15,8 +24,10 @@ async def recreate_tables() -> None:
     import web.models.__all_models
 
     async with engine.begin() as conn:
+        await conn.run_sync(drop_search_index)
         await conn.run_sync(settings.DBBaseModel.metadata.drop_all)
         await conn.run_sync(settings.DBBaseModel.metadata.create_all)
+        await conn.run_sync(create_search_index)
         print("Tables recreated successfully (all data lost)")
         await conn.commit()
 